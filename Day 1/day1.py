@@ -5,18 +5,36 @@ Example first three lines from .txt file:
 37930   31308
 """
 
+import sys
+import tempfile
+from bisect import bisect_right
 from pathlib import Path
 from collections import Counter
+from itertools import zip_longest
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.external_sort import Int64Writer, iter_chunks, iter_int64_file, merge_runs, write_run
+from aoc.parsing import parse_ints, read_int_columns
+
+# Row count from which the NumPy engine beats the pure-Python one
+NUMPY_THRESHOLD = 2000
+
+INT64_LIMIT = 2 ** 63
+
+# Inputs from this size on are processed out of core by the streaming mode
+STREAM_THRESHOLD_BYTES = 1 << 30
+STREAM_CHUNK_BYTES = 64 << 20
+
+def read_input_arrays(file_path):
+    """Read the input file and return two int64 arrays (object arrays of Python ints for very long IDs)."""
+    return read_int_columns(file_path, 2)
 
 def read_input_file(file_path):
     """Read the input file and return two lists of integers."""
-    left_list, right_list = [], []
-    with open(file_path, 'r') as f:
-        for line in f:
-            left, right = map(int, line.split())
-            left_list.append(left)
-            right_list.append(right)
-    return left_list, right_list
+    left_column, right_column = read_input_arrays(file_path)
+    return left_column.tolist(), right_column.tolist()
 
 def calculate_total_distance(left_list, right_list):
     """Calculate the total distance between sorted lists."""
@@ -29,19 +47,336 @@ def calculate_similarity_score(left_list, right_list):
     right_counter = Counter(right_list)
     return sum(num * right_counter[num] for num in left_list if num in right_counter)
 
+def calculate_total_distance_numpy(left, right):
+    """Calculate the total distance with NumPy; gives the same result as calculate_total_distance."""
+    left, right = np.sort(left), np.sort(right)
+    if not left.size:
+        return 0
+
+    # Fall back to exact Python ints if the sum could overflow int64
+    max_distance = max(int(left[-1]) - int(right[0]), int(right[-1]) - int(left[0]))
+    if max_distance * left.size >= INT64_LIMIT:
+        return sum(abs(a - b) for a, b in zip(left.tolist(), right.tolist()))
+    return int(np.abs(left - right).sum())
+
+def calculate_similarity_score_numpy(left, right):
+    """Calculate the similarity score with NumPy; gives the same result as calculate_similarity_score."""
+    right_values, right_counts = np.unique(right, return_counts=True)
+    if not right_values.size:
+        return 0
+
+    # Look up how often each left value occurs in the right list (0 if absent)
+    positions = np.minimum(np.searchsorted(right_values, left), right_values.size - 1)
+    weights = np.where(right_values[positions] == left, right_counts[positions], 0)
+
+    # Fall back to exact Python ints if the sum could overflow int64
+    max_value = max(abs(int(left.min())), abs(int(left.max())))
+    if max_value * int(right_counts.max()) * left.size >= INT64_LIMIT:
+        return sum(a * w for a, w in zip(left.tolist(), weights.tolist()))
+    return int((left * weights).sum())
+
+def _write_run_lengths(sorted_values, writer):
+    """Write a sorted stream as (value, count) pairs, passing every value through."""
+    previous, count = None, 0
+    for value in sorted_values:
+        if value == previous:
+            count += 1
+        else:
+            if count:
+                writer.write(previous, count)
+            previous, count = value, 1
+        yield value
+    if count:
+        writer.write(previous, count)
+
+def _iter_pairs(path):
+    """Read back the (value, count) pairs written by _write_run_lengths."""
+    values = iter_int64_file(path)
+    return zip(values, values)
+
+def calculate_totals_streaming(file_path, chunk_bytes=STREAM_CHUNK_BYTES, tmp_dir=None):
+    """
+    Calculate both answers out of core, holding only one chunk in memory.
+
+    Each chunk's columns are sorted into run files, then a k-way merge pairs
+    the columns by rank for the total distance. The same pass writes each
+    column's (value, count) table to disk, and a merge join of the two
+    tables gives the similarity score.
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        run_dir = Path(run_dir)
+
+        # Sort each chunk's columns into run files
+        left_runs, right_runs = [], []
+        for i, chunk in enumerate(iter_chunks(file_path, chunk_bytes)):
+            values, _ = parse_ints(chunk)
+            if values.dtype == object:
+                raise ValueError("Streaming mode needs location IDs that fit in int64")
+            pairs = values.reshape(-1, 2)
+            left_runs.append(write_run(pairs[:, 0], run_dir / f"left_{i}.run"))
+            right_runs.append(write_run(pairs[:, 1], run_dir / f"right_{i}.run"))
+
+        # Part 1: Pair the merged columns by rank, counting each value on the way
+        total_distance = 0
+        with Int64Writer(run_dir / 'left.counts') as left_counts, Int64Writer(run_dir / 'right.counts') as right_counts:
+            left_sorted = _write_run_lengths(merge_runs(left_runs), left_counts)
+            right_sorted = _write_run_lengths(merge_runs(right_runs), right_counts)
+            # zip_longest runs both generators to the end so each writes its last count
+            for a, b in zip_longest(left_sorted, right_sorted):
+                total_distance += abs(a - b)
+
+        # Part 2: Merge join the two count tables
+        similarity_score = 0
+        right_pairs = _iter_pairs(run_dir / 'right.counts')
+        right_value, right_count = next(right_pairs, (None, 0))
+        for left_value, left_count in _iter_pairs(run_dir / 'left.counts'):
+            while right_value is not None and right_value < left_value:
+                right_value, right_count = next(right_pairs, (None, 0))
+            if right_value == left_value:
+                similarity_score += left_value * left_count * right_count
+
+    return total_distance, similarity_score
+
+class _StepBlock:
+    """
+    A run of consecutive segments of a _StepFunction.
+
+    Segment i starts at xs[i], has width ws[i] and value vals[i] + lazy.
+    hist maps a stored value to the total width holding it, so the width
+    at any actual value is known without visiting the segments.
+    """
+
+    def __init__(self, xs, vals, ws, lazy=0):
+        self.xs, self.vals, self.ws, self.lazy = xs, vals, ws, lazy
+        self.rebuild()
+
+    def rebuild(self):
+        self.hist = {}
+        self.width = self.negative_width = 0
+        for val, w in zip(self.vals, self.ws):
+            self.hist[val] = self.hist.get(val, 0) + w
+            self.width += w
+            if val + self.lazy < 0:
+                self.negative_width += w
+
+class _StepFunction:
+    """
+    Integer step function g(x), zero before its first breakpoint and after
+    its last, supporting +-1 updates over [start, stop) while keeping
+    total = sum of |g(x)| over all integers x up to date.
+
+    Segments are kept sorted in blocks of about BLOCK_SIZE (square-root
+    decomposition): a whole block is shifted through its lazy offset and
+    histogram in O(1), so an update costs O(blocks + BLOCK_SIZE).
+    """
+
+    BLOCK_SIZE = 256
+
+    def __init__(self, xs=(), values=()):
+        """Build from sorted distinct breakpoints and the value of g from each one on."""
+        xs, values = list(xs), list(values)
+        ws = [b - a for a, b in zip(xs, xs[1:])] + [0] * bool(xs)
+        self.blocks = [
+            _StepBlock(xs[i:i + self.BLOCK_SIZE], values[i:i + self.BLOCK_SIZE], ws[i:i + self.BLOCK_SIZE])
+            for i in range(0, len(xs), self.BLOCK_SIZE)
+        ]
+        self.firsts = [block.xs[0] for block in self.blocks]
+        self.total = sum(abs(v) * w for v, w in zip(values, ws))
+
+    def _add_breakpoint(self, x):
+        """Make x a breakpoint; splitting a segment does not change g or total."""
+        if not self.blocks:
+            self.blocks.append(_StepBlock([x], [0], [0]))
+            self.firsts.append(x)
+            return
+
+        k = bisect_right(self.firsts, x) - 1
+        if k == -1:
+            # New leading segment where g is 0
+            block = self.blocks[0]
+            w = block.xs[0] - x
+            block.xs.insert(0, x)
+            block.vals.insert(0, -block.lazy)
+            block.ws.insert(0, w)
+            block.hist[-block.lazy] = block.hist.get(-block.lazy, 0) + w
+            block.width += w
+            self.firsts[0] = x
+            k = 0
+        else:
+            block = self.blocks[k]
+            i = bisect_right(block.xs, x) - 1
+            if block.xs[i] == x:
+                return
+            val = block.vals[i]
+            if i + 1 < len(block.xs):
+                next_x = block.xs[i + 1]
+            elif k + 1 < len(self.blocks):
+                next_x = self.firsts[k + 1]
+            else:
+                # The trailing segment (g = 0, width 0) now ends at x
+                next_x = x
+                block.hist[val] = block.hist.get(val, 0) + (x - block.xs[i])
+                block.width += x - block.xs[i]
+            block.ws[i] = x - block.xs[i]
+            block.xs.insert(i + 1, x)
+            block.vals.insert(i + 1, val)
+            block.ws.insert(i + 1, next_x - x)
+
+        if len(block.xs) > 2 * self.BLOCK_SIZE:
+            half = len(block.xs) // 2
+            tail = _StepBlock(block.xs[half:], block.vals[half:], block.ws[half:], block.lazy)
+            del block.xs[half:], block.vals[half:], block.ws[half:]
+            block.rebuild()
+            self.blocks.insert(k + 1, tail)
+            self.firsts.insert(k + 1, tail.xs[0])
+
+    def _locate(self, x):
+        """Return (block index, segment index) of breakpoint x."""
+        k = bisect_right(self.firsts, x) - 1
+        return k, bisect_right(self.blocks[k].xs, x) - 1
+
+    def _add_segments(self, block, start, stop, delta):
+        """Add delta to segments start..stop-1 of one block, one at a time."""
+        for i in range(start, stop):
+            val, w = block.vals[i], block.ws[i]
+            actual = val + block.lazy
+            self.total += w * (abs(actual + delta) - abs(actual))
+            remaining = block.hist.get(val, 0) - w
+            if remaining:
+                block.hist[val] = remaining
+            else:
+                block.hist.pop(val, None)
+            block.hist[val + delta] = block.hist.get(val + delta, 0) + w
+            block.vals[i] = val + delta
+            block.negative_width += w * ((actual + delta < 0) - (actual < 0))
+
+    def _add_block(self, block, delta):
+        """Add delta to every segment of a block through its lazy offset."""
+        if delta > 0:
+            self.total += block.width - 2 * block.negative_width
+            block.negative_width -= block.hist.get(-1 - block.lazy, 0)
+        else:
+            non_positive = block.negative_width + block.hist.get(-block.lazy, 0)
+            self.total += 2 * non_positive - block.width
+            block.negative_width = non_positive
+        block.lazy += delta
+
+    def add(self, start, stop, delta):
+        """Add delta (+1 or -1) to g(x) for start <= x < stop."""
+        if start >= stop:
+            return
+        self._add_breakpoint(start)
+        self._add_breakpoint(stop)
+        k_start, i_start = self._locate(start)
+        k_stop, i_stop = self._locate(stop)
+
+        if k_start == k_stop:
+            self._add_segments(self.blocks[k_start], i_start, i_stop, delta)
+            return
+        self._add_segments(self.blocks[k_start], i_start, len(self.blocks[k_start].xs), delta)
+        for k in range(k_start + 1, k_stop):
+            self._add_block(self.blocks[k], delta)
+        self._add_segments(self.blocks[k_stop], 0, i_stop, delta)
+
+class IncrementalLocationLists:
+    """
+    Keeps both answers current while pairs are added and removed.
+
+    The similarity score is sum(v * left_count[v] * right_count[v]), so one
+    value changes it by a single count lookup. The total distance between
+    the sorted lists equals the sum over all integers x of
+    |#left <= x  -  #right <= x|. A pair (a, b) therefore adds +-1 to that
+    difference on [min(a, b), max(a, b)), which _StepFunction applies in
+    sub-linear time.
+    """
+
+    def __init__(self, left_list=(), right_list=()):
+        """Start from two equal-length lists of location IDs."""
+        left_list, right_list = list(left_list), list(right_list)
+        if len(left_list) != len(right_list):
+            raise ValueError("Both lists must have the same length")
+
+        self.left_counts = Counter(left_list)
+        self.right_counts = Counter(right_list)
+        self.similarity_score = calculate_similarity_score(left_list, right_list)
+
+        # g changes at each value by (left count - right count)
+        xs = sorted(self.left_counts.keys() | self.right_counts.keys())
+        values, running = [], 0
+        for x in xs:
+            running += self.left_counts[x] - self.right_counts[x]
+            values.append(running)
+        self._steps = _StepFunction(xs, values)
+        self._size = len(left_list)
+
+    @property
+    def total_distance(self):
+        """Total distance between the sorted lists."""
+        return self._steps.total
+
+    def __len__(self):
+        return self._size
+
+    def _update_distance(self, left, right, sign):
+        if left < right:
+            self._steps.add(left, right, sign)
+        else:
+            self._steps.add(right, left, -sign)
+
+    def add_pair(self, left, right):
+        """Add one value to each list."""
+        self.left_counts[left] += 1
+        self.similarity_score += left * self.right_counts[left]
+        self.right_counts[right] += 1
+        self.similarity_score += right * self.left_counts[right]
+        self._update_distance(left, right, 1)
+        self._size += 1
+
+    def remove_pair(self, left, right):
+        """Remove one occurrence of left from the left list and of right from the right list."""
+        if self.left_counts[left] == 0 or self.right_counts[right] == 0:
+            raise ValueError(f"Pair ({left}, {right}) is not in the lists")
+        self.similarity_score -= right * self.left_counts[right]
+        self.right_counts[right] -= 1
+        self.similarity_score -= left * self.right_counts[left]
+        self.left_counts[left] -= 1
+        self._update_distance(left, right, -1)
+        self._size -= 1
+
+def solve(input_file, stream=None):
+    """
+    Compute the total distance (Part 1) and similarity score (Part 2).
+    Inputs of STREAM_THRESHOLD_BYTES or more are streamed unless stream is given.
+    """
+    if stream is None:
+        stream = Path(input_file).stat().st_size >= STREAM_THRESHOLD_BYTES
+    if stream:
+        return calculate_totals_streaming(input_file)
+
+    # Read input columns
+    left, right = read_input_arrays(input_file)
+
+    # Large inputs use the NumPy engine, small ones and IDs too long for int64 the pure-Python one
+    if left.size >= NUMPY_THRESHOLD and left.dtype != object:
+        total_distance = calculate_total_distance_numpy(left, right)
+        similarity_score = calculate_similarity_score_numpy(left, right)
+    else:
+        left_list, right_list = left.tolist(), right.tolist()
+
+        # Part 1: Total distance
+        total_distance = calculate_total_distance(left_list, right_list)
+
+        # Part 2: Similarity score
+        similarity_score = calculate_similarity_score(left_list, right_list)
+
+    return total_distance, similarity_score
+
 def main():
     """Main function to calculate and print results."""
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read input lists
-    left_list, right_list = read_input_file(input_file)
-
-    # Part 1: Total distance
-    total_distance = calculate_total_distance(left_list, right_list)
+    total_distance, similarity_score = solve(input_file)
     print("Total Distance:", total_distance)
-
-    # Part 2: Similarity score
-    similarity_score = calculate_similarity_score(left_list, right_list)
     print("Similarity Score:", similarity_score)
 
 if __name__ == "__main__":
@@ -1,37 +1,25 @@
+import sys
 from pathlib import Path
-import subprocess
 
-# Direction vectors for moving up, down, left, and right
-dd = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.grid import Grid
+
+PEAK = ord('9')
 
 def read_input_file(file_path):
     """
-    Reads the input file and returns the grid as a list of lists.
-    """
-    with open(file_path, 'r') as f:
-        return [list(line.strip()) for line in f]
-    
-def in_grid(grid, row, col):
-    """
-    Checks if a given position (row, col) is within the bounds of the grid.
+    Reads the input file and returns the grid.
     """
-    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
+    return Grid.from_file(file_path)
 
-    
 def get_trailhead_locations(grid):
     """
     Finds all positions in the grid that are trailheads (height '0').
     """
-    trailhead_locations = []
-
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == '0':
-                trailhead_locations.append((row, col))
-
-    return trailhead_locations
+    return grid.positions_of('0')
 
 def get_scores(grid, trailhead_locations):
+    data = grid.data
     scores = []
 
     for trailhead in trailhead_locations:
@@ -41,33 +29,30 @@ def get_scores(grid, trailhead_locations):
         stack = [trailhead]
         visited = set()
         while stack:
-            i, j = stack.pop()
+            i = stack.pop()
 
-            if (i, j) in visited:
+            if i in visited:
                 continue
 
-            visited.add((i, j))
+            visited.add(i)
 
-            if grid[i][j] == '9':
+            if data[i] == PEAK:
                 score += 1
                 continue
 
-            for di, dj in dd:
-                new_i, new_j = i + di, j + dj
-                
-                if not in_grid(grid, new_i, new_j):
-                    continue
-
-                if int(grid[new_i][new_j]) != int(grid[i][j]) + 1:
-                    continue
-
-                stack.append((new_i, new_j))
+            # Digits are consecutive bytes and the border is never a digit,
+            # so this also rejects steps off the grid
+            next_height = data[i] + 1
+            for offset in grid.orthogonal_offsets:
+                if data[i + offset] == next_height:
+                    stack.append(i + offset)
 
         scores.append(score)
         
     return scores
 
 def get_ratings(grid, trailhead_locations):
+    data = grid.data
     scores = []
 
     for trailhead in trailhead_locations:
@@ -75,37 +60,25 @@ def get_ratings(grid, trailhead_locations):
 
         stack = [trailhead]
         while stack:
-            i, j = stack.pop()
+            i = stack.pop()
 
-            if grid[i][j] == '9':
+            if data[i] == PEAK:
                 score += 1
                 continue
 
-            for di, dj in dd:
-                new_i, new_j = i + di, j + dj
-                
-                if not in_grid(grid, new_i, new_j):
-                    continue
-
-                if int(grid[new_i][new_j]) != int(grid[i][j]) + 1:
-                    continue
-
-                stack.append((new_i, new_j))
+            next_height = data[i] + 1
+            for offset in grid.orthogonal_offsets:
+                if data[i + offset] == next_height:
+                    stack.append(i + offset)
 
         scores.append(score)
         
     return scores
 
-def main():
+def solve(input_file):
     """
-    Main function to compute solutions for Part 1 and Part 2.
+    Computes the sum of trailhead scores (Part 1) and ratings (Part 2).
     """
-    # Clear the terminal
-    subprocess.run(["cls"], shell=True)
-
-    # Define the input file path
-    input_file = Path(__file__).parent / 'input.txt'
-
     # Read and parse the input data
     grid = read_input_file(input_file)
 
@@ -114,11 +87,22 @@ def main():
 
     # Part 1: Compute the sum of scores for all trailheads
     part_1_scores = get_scores(grid, trailhead_locations)
-    print("Part 1:", sum(part_1_scores))
 
     # Part 2: Compute the sum of ratings for all trailheads
     part_2_ratings = get_ratings(grid, trailhead_locations)
-    print("Part 2:", sum(part_2_ratings))
+
+    return sum(part_1_scores), sum(part_2_ratings)
+
+def main():
+    """
+    Main function to compute solutions for Part 1 and Part 2.
+    """
+    # Define the input file path
+    input_file = Path(__file__).parent / 'input.txt'
+
+    part_1, part_2 = solve(input_file)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
 if __name__ == "__main__":
     main()
@@ -5,9 +5,22 @@ Example first three lines from .txt file:
 15 18 20 21 23 25 28 32
 """
 
-import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.parsing import csr_to_lists, read_int_rows
+
+# Reports up to this many levels are checked as NumPy matrices, longer ones one by one
+MATRIX_MAX_LEVELS = 16
+
+# Reports per worker task, and the report count from which a process pool is used
+CHUNK_REPORTS = 250_000
+PARALLEL_THRESHOLD = 500_000
+
 def is_safe(report):
     """Check if a report is safe according to the rules."""
     diffs = [report[i + 1] - report[i] for i in range(len(report) - 1)]
@@ -16,12 +29,31 @@ def is_safe(report):
     is_decreasing = all(-3 <= diff <= -1 for diff in diffs)
     return is_increasing or is_decreasing
 
+def first_bad_step(report, sign, skip=-1):
+    """
+    Find the first step that breaks the rules in the given direction (1 for
+    increasing, -1 for decreasing), ignoring the level at index skip.
+    Returns the index of the level before that step, or -1 if there is none.
+    """
+    previous = -1
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if previous != -1 and not 1 <= (level - report[previous]) * sign <= 3:
+            return previous
+        previous = i
+    return -1
+
 def is_safe_with_dampener(report):
-    """Check if a report can be made safe by removing one level."""
-    for i in range(len(report)):
-        # Create a new report with one level removed
-        modified_report = report[:i] + report[i+1:]
-        if is_safe(modified_report):
+    """Check if a report can be made safe by removing at most one level."""
+    for sign in (1, -1):
+        bad = first_bad_step(report, sign)
+        if bad == -1:
+            return True
+
+        # Every step before the bad one is fine, so only removing one of the
+        # two levels around it can help
+        if first_bad_step(report, sign, skip=bad) == -1 or first_bad_step(report, sign, skip=bad + 1) == -1:
             return True
     return False
 
@@ -33,21 +65,135 @@ def count_safe_reports_with_dampener(reports):
             safe_count += 1
     return safe_count
 
+def min_removals_to_safe(report, max_removals=None):
+    """
+    Find the fewest levels to remove so that the report becomes safe.
+
+    Dynamic program per direction: best[j] is the fewest removals among
+    levels 0..j that keep level j and leave a safe prefix. With at most k
+    removals the kept level before j is one of the k + 1 levels before it,
+    so each direction costs O(n * k).
+
+    Returns None if max_removals is given and more removals are needed.
+    """
+    n = len(report)
+    if n <= 1:
+        return 0
+    k = n - 1 if max_removals is None else min(max_removals, n - 1)
+
+    fewest = None
+    for sign in (1, -1):
+        best = [0] * n
+        for j in range(n):
+            # Removing every level before j, or keeping level i and removing those between
+            cost = j if j <= k else k + 1
+            for i in range(max(0, j - k - 1), j):
+                removals = best[i] + j - i - 1
+                if removals < cost and 1 <= (report[j] - report[i]) * sign <= 3:
+                    cost = removals
+            best[j] = cost
+
+            # Removing every level after j
+            total = cost + n - 1 - j
+            if total <= k and (fewest is None or total < fewest):
+                fewest = total
+    return fewest
+
+def count_safe_reports(reports, max_removals=0):
+    """Count the reports that can be made safe by removing at most max_removals levels."""
+    return sum(min_removals_to_safe(report, max_removals) is not None for report in reports)
+
 def read_input_file(file_path):
     """Read the puzzle input from a file."""
-    with open(file_path, 'r') as f:
-        return [[int(num) for num in line.strip().split()] for line in f]
+    return csr_to_lists(*read_int_rows(file_path))
+
+def all_steps_safe(diffs):
+    """For a matrix of level differences, check each row is all increasing or all decreasing by 1-3."""
+    is_increasing = ((diffs >= 1) & (diffs <= 3)).all(axis=1)
+    is_decreasing = ((diffs >= -3) & (diffs <= -1)).all(axis=1)
+    return is_increasing | is_decreasing
+
+def count_safe_reports_csr(values, offsets):
+    """
+    Count the safe reports without and with the dampener in one pass over
+    reports in CSR form (report i is values[offsets[i]:offsets[i + 1]]).
+
+    Reports are grouped by length, and each group is checked as a matrix of
+    level differences. Removing level i merges differences i - 1 and i, so
+    the dampener tries every removal with one matrix operation per column.
+    """
+    lengths = np.diff(offsets)
+    num_safe = num_safe_with_dampener = 0
+
+    for length in np.unique(lengths).tolist():
+        rows = np.flatnonzero(lengths == length)
+
+        if length > MATRIX_MAX_LEVELS:
+            for row in rows.tolist():
+                report = values[offsets[row]:offsets[row + 1]].tolist()
+                safe = is_safe(report)
+                num_safe += safe
+                num_safe_with_dampener += safe or is_safe_with_dampener(report)
+            continue
+
+        diffs = np.diff(values[offsets[rows][:, None] + np.arange(length)], axis=1)
+        safe = all_steps_safe(diffs)
+        fixable = safe.copy()
+        for i in range(length):
+            if i == 0:
+                remaining = diffs[:, 1:]
+            elif i == length - 1:
+                remaining = diffs[:, :-1]
+            else:
+                merged = (diffs[:, i - 1] + diffs[:, i])[:, None]
+                remaining = np.concatenate([diffs[:, :i - 1], merged, diffs[:, i + 1:]], axis=1)
+            fixable |= all_steps_safe(remaining)
+
+        num_safe += int(safe.sum())
+        num_safe_with_dampener += int(fixable.sum())
+
+    return num_safe, num_safe_with_dampener
+
+def count_safe_reports_parallel(values, offsets, max_workers=None, chunk_reports=CHUNK_REPORTS):
+    """
+    Split CSR reports into chunks along the offsets and count each chunk in a
+    worker process. Returns the counts without and with the dampener.
+    """
+    num_reports = len(offsets) - 1
+    num_safe = num_safe_with_dampener = 0
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for start in range(0, num_reports, chunk_reports):
+            stop = min(start + chunk_reports, num_reports)
+            chunk_offsets = offsets[start:stop + 1]
+            futures.append(executor.submit(
+                count_safe_reports_csr,
+                values[chunk_offsets[0]:chunk_offsets[-1]],
+                chunk_offsets - chunk_offsets[0],
+            ))
+        for future in futures:
+            safe, safe_with_dampener = future.result()
+            num_safe += safe
+            num_safe_with_dampener += safe_with_dampener
+
+    return num_safe, num_safe_with_dampener
+
+def solve(input_file):
+    """Count the safe reports without (Part 1) and with (Part 2) the dampener."""
+    # Read the reports from the input file once, in CSR form
+    values, offsets = read_int_rows(input_file)
+
+    # Count both kinds of safe report in a single pass
+    if len(offsets) - 1 >= PARALLEL_THRESHOLD:
+        return count_safe_reports_parallel(values, offsets)
+    return count_safe_reports_csr(values, offsets)
 
 def main():
     """Main function to process the input file and count safe reports."""
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read the reports from the input file
-    reports = read_input_file(input_file)
-
-    # Count safe reports
-    num_safe_reports = sum(is_safe(report) for report in reports)
-    num_safe_with_dampener = count_safe_reports_with_dampener(reports)
+    num_safe_reports, num_safe_with_dampener = solve(input_file)
 
     print("Safe reports:", num_safe_reports)
     print("Safe reports with dampener:", num_safe_with_dampener)
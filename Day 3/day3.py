@@ -1,6 +1,21 @@
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# mul(x,y), do() and don't() tokens in the raw bytes
+TOKEN_PATTERN = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+# A prefix of a token running up to the end of the scanned window
+PARTIAL_TOKEN_PATTERN = re.compile(rb"(?:m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t(?:\()?)?)?)?)?)\Z")
+
+# Bytes scanned per window
+CHUNK_SIZE = 1 << 20
+
+# Inputs from this size on are scanned in parallel
+PARALLEL_THRESHOLD_BYTES = 64 << 20
+
 def extract_valid_mul_instructions_part_1(memory):
     """Extract and evaluate valid mul instructions from the given memory string."""
     # Regular expression to match valid mul instructions (e.g., mul(44,46))
@@ -36,24 +51,143 @@ def extract_valid_mul_instructions_part_2(memory):
 
     return total_sum
 
+def scan_segment(buffer, start=0, stop=None, chunk_size=CHUNK_SIZE):
+    """
+    Sum the mul instructions of every token starting in buffer[start:stop],
+    scanning a bytes-like buffer (such as an mmap) in windows of chunk_size
+    bytes. The last token may run past stop.
+
+    A token cut off by the end of a window is not lost: the next window
+    starts at the beginning of that partial token instead of at the window
+    end, so no bytes are copied. Tokens never overlap, so segments scanned
+    separately find exactly the tokens of a full scan.
+
+    The enable state at start is not known yet, so Part 2 is summed for
+    both possibilities: mul instructions before the first do()/don't()
+    count only if the segment starts enabled.
+
+    Args:
+        buffer (bytes): The corrupted memory.
+        start (int): First byte of the segment.
+        stop (int): End of the segment. Defaults to the end of the buffer.
+        chunk_size (int): Window size in bytes.
+
+    Returns:
+        tuple: (part 1 sum, part 2 sum if starting enabled, part 2 sum if
+               starting disabled, enable state at the end or None if the
+               segment has no do()/don't()).
+    """
+    size = len(buffer)
+    stop = size if stop is None else min(stop, size)
+    part_1_sum = leading_sum = tracked_sum = 0
+    enabled = None
+    partial = None
+    end = start
+
+    def process(match):
+        nonlocal part_1_sum, leading_sum, tracked_sum, enabled
+        if match.group(1):
+            product = int(match.group(1)) * int(match.group(2))
+            part_1_sum += product
+            if enabled is None:
+                leading_sum += product
+            elif enabled:
+                tracked_sum += product
+        else:
+            enabled = match.group(0) == b"do()"
+
+    while end < stop:
+        end = min(end + chunk_size, stop)
+        last_end = start
+
+        for match in TOKEN_PATTERN.finditer(buffer, start, end):
+            process(match)
+            last_end = match.end()
+
+        # Resume at a token that may continue past this window
+        partial = PARTIAL_TOKEN_PATTERN.search(buffer, last_end, end)
+        start = partial.start() if partial else end
+
+    # A token starting in this segment may finish in the next one
+    if partial and stop < size:
+        match = TOKEN_PATTERN.match(buffer, partial.start())
+        if match:
+            process(match)
+
+    return part_1_sum, leading_sum + tracked_sum, tracked_sum, enabled
+
+def combine_segments(segments, enabled=True):
+    """
+    Combine scan_segment results from left to right into the Part 1 sum,
+    the Part 2 sum and the final enable state.
+    """
+    part_1_sum = part_2_sum = 0
+    for segment_part_1, sum_if_enabled, sum_if_disabled, final_state in segments:
+        part_1_sum += segment_part_1
+        part_2_sum += sum_if_enabled if enabled else sum_if_disabled
+        if final_state is not None:
+            enabled = final_state
+    return part_1_sum, part_2_sum, enabled
+
+def scan_memory(buffer, chunk_size=CHUNK_SIZE, enabled=True):
+    """
+    Sum the mul instructions for both parts in a single pass over a bytes-like buffer.
+
+    Returns:
+        tuple: (part 1 sum, part 2 sum, enabled state at the end).
+    """
+    return combine_segments([scan_segment(buffer, chunk_size=chunk_size)], enabled)
+
+def scan_file_segment(file_path, start, stop, chunk_size=CHUNK_SIZE):
+    """Memory-map the input file and scan one segment of it (see scan_segment)."""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return scan_segment(memory, start, stop, chunk_size)
+
+def scan_file(file_path, chunk_size=CHUNK_SIZE):
+    """Memory-map the input file and sum the mul instructions for both parts in one pass."""
+    if not os.path.getsize(file_path):
+        return 0, 0  # mmap cannot map an empty file
+    part_1_sum, part_2_sum, _ = combine_segments([scan_file_segment(file_path, 0, None, chunk_size)])
+    return part_1_sum, part_2_sum
+
+def scan_file_parallel(file_path, num_segments=None, max_workers=None):
+    """
+    Split the input file into segments, scan them in worker processes and
+    combine the results left to right. Each worker maps the file itself, so
+    no data is sent between processes.
+    """
+    size = os.path.getsize(file_path)
+    if not size:
+        return 0, 0
+    if num_segments is None:
+        num_segments = 4 * (os.cpu_count() or 1)
+    bounds = [size * i // num_segments for i in range(num_segments + 1)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(scan_file_segment, file_path, start, stop)
+                   for start, stop in zip(bounds, bounds[1:]) if start < stop]
+        part_1_sum, part_2_sum, _ = combine_segments(future.result() for future in futures)
+    return part_1_sum, part_2_sum
+
 def read_input_file(file_path):
     """Read the input file and return its content as a single string."""
     with open(file_path, 'r') as f:
         return f.read()
 
+def solve(input_file):
+    """Sum the valid mul instructions without (Part 1) and with (Part 2) control instructions."""
+    # Scan the memory-mapped input once for both parts, in parallel segments if large
+    if os.path.getsize(input_file) >= PARALLEL_THRESHOLD_BYTES:
+        return scan_file_parallel(input_file)
+    return scan_file(input_file)
+
 def main():
     """Main function to process the corrupted memory and calculate the sum."""
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read the corrupted memory from the input file
-    corrupted_memory = read_input_file(input_file)
-
-    # Extract and sum valid mul instructions
-    part_1_sum = extract_valid_mul_instructions_part_1(corrupted_memory)
+    part_1_sum, part_2_sum = solve(input_file)
     print("Sum of valid mul instructions (part 1):", part_1_sum)
-
-    # Extract and sum valid mul instructions with control instructions
-    part_2_sum = extract_valid_mul_instructions_part_2(corrupted_memory)
     print("Sum of valid mul instructions (part 2):", part_2_sum)
 
 if __name__ == "__main__":
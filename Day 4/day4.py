@@ -1,85 +1,156 @@
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.aho_corasick import AhoCorasick
+from aoc.grid import Grid
+from aoc.stencil import Stencil, count_matches
+
+# Grid size (in cells) from which the NumPy engine is used
+NUMPY_THRESHOLD = 2500
+
+# All 8 directions as (row step, column step)
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+# One X-MAS; its four rotations cover every way of reading the two MAS diagonals
+XMAS_STENCILS = Stencil([
+    "M.S",
+    ".A.",
+    "M.S",
+]).variants(rotations=True)
+
 def count_word_in_grid(grid, word):
     """Count all occurrences of a word in the grid in all directions."""
-    rows = len(grid)
-    cols = len(grid[0])
-    word_len = len(word)
-    directions = [
-        (0, 1),   # Right
-        (0, -1),  # Left
-        (1, 0),   # Down
-        (-1, 0),  # Up
-        (1, 1),   # Diagonal down-right
-        (1, -1),  # Diagonal down-left
-        (-1, 1),  # Diagonal up-right
-        (-1, -1), # Diagonal up-left
-    ]
+    data = grid.data
+    letters = word.encode()
+    first = letters[0]
     count = 0
 
-    def is_valid(r, c):
-        return 0 <= r < rows and 0 <= c < cols
-
-    for r in range(rows):
-        for c in range(cols):
-            for dr, dc in directions:
-                # Check if the word can fit in this direction
-                if all(
-                    is_valid(r + dr * i, c + dc * i) and grid[r + dr * i][c + dc * i] == word[i]
-                    for i in range(word_len)
-                ):
-                    count += 1
+    # The grid border never matches a letter, so a word running off the grid
+    # fails on its first padding cell and no explicit bounds check is needed
+    for start in grid.indices():
+        if data[start] != first:
+            continue
+        for offset in grid.neighbour_offsets:
+            if all(data[start + offset * i] == letters[i] for i in range(1, len(letters))):
+                count += 1
 
     return count
 
 def count_xmas_in_grid(grid):
     """Count all occurrences of X-MAS patterns in the grid."""
-    rows = len(grid)
-    cols = len(grid[0])
+    data = grid.data
+    s = grid.stride
     xmas_count = 0
 
-    # Helper function to check if indices are valid
-    def is_valid(r, c):
-        return 0 <= r < rows and 0 <= c < cols
-
-    # Check for the X-MAS pattern at a given center (r, c)
-    def is_xmas_center(r, c):
-        patterns = [
-            ((-1, -1, "M"), (0, 0, "A"), (1, 1, "S"), (-1, 1, "M"), (1, -1, "S")),
-            ((-1, -1, "M"), (0, 0, "A"), (1, 1, "S"), (-1, 1, "S"), (1, -1, "M")),
-            ((-1, -1, "S"), (0, 0, "A"), (1, 1, "M"), (-1, 1, "S"), (1, -1, "M")),
-            ((-1, -1, "S"), (0, 0, "A"), (1, 1, "M"), (-1, 1, "M"), (1, -1, "S"))
-        ]
+    # Corner patterns as (offset, letter) pairs: up-left, down-right, up-right, down-left
+    patterns = [
+        ((-s - 1, ord("M")), (s + 1, ord("S")), (-s + 1, ord("M")), (s - 1, ord("S"))),
+        ((-s - 1, ord("M")), (s + 1, ord("S")), (-s + 1, ord("S")), (s - 1, ord("M"))),
+        ((-s - 1, ord("S")), (s + 1, ord("M")), (-s + 1, ord("S")), (s - 1, ord("M"))),
+        ((-s - 1, ord("S")), (s + 1, ord("M")), (-s + 1, ord("M")), (s - 1, ord("S"))),
+    ]
+
+    # Check for the X-MAS pattern at a given center index
+    def is_xmas_center(i):
         for pattern in patterns:
-            if all(is_valid(r + dr, c + dc) and grid[r + dr][c + dc] == char for dr, dc, char in pattern):
+            if all(data[i + offset] == char for offset, char in pattern):
                 return True
         return False
 
-    # Scan the grid for all possible centers
-    for r in range(1, rows - 1):
-        for c in range(1, cols - 1):
-            if grid[r][c] == "A" and is_xmas_center(r, c):
-                xmas_count += 1
+    # Scan the grid for all possible centers; corners on the border hold padding and never match
+    a = ord("A")
+    for i in grid.indices():
+        if data[i] == a and is_xmas_center(i):
+            xmas_count += 1
 
     return xmas_count
 
+def count_word_in_grid_numpy(grid, word):
+    """
+    Count all occurrences of a word in all directions with NumPy.
+    For each direction, the letter array is sliced once per letter, shifted
+    by that letter's offset along the direction, and the comparisons are ANDed.
+    """
+    letters = grid.to_numpy()
+    rows, cols = letters.shape
+    span = len(word) - 1
+    count = 0
+
+    for dr, dc in DIRECTIONS:
+        # Start cells from which the whole word stays on the grid
+        r0, r1 = max(0, -dr * span), rows - max(0, dr * span)
+        c0, c1 = max(0, -dc * span), cols - max(0, dc * span)
+        if r0 >= r1 or c0 >= c1:
+            continue
+
+        match = np.ones((r1 - r0, c1 - c0), dtype=bool)
+        for i, char in enumerate(word.encode()):
+            match &= letters[r0 + dr * i:r1 + dr * i, c0 + dc * i:c1 + dc * i] == char
+        count += int(match.sum())
+
+    return count
+
+def count_xmas_in_grid_numpy(grid):
+    """Count all occurrences of X-MAS patterns with NumPy, checking every center at once."""
+    return count_matches(grid.to_numpy(), XMAS_STENCILS)
+
+def grid_lines(grid):
+    """Yield every row, column, diagonal and anti-diagonal of the grid as bytes, each read one way."""
+    letters = grid.to_numpy()
+    rows, cols = letters.shape
+    flipped = letters[:, ::-1]
+
+    yield from (row.tobytes() for row in letters)
+    yield from (column.tobytes() for column in letters.T)
+    for offset in range(-(rows - 1), cols):
+        yield letters.diagonal(offset).tobytes()
+        yield flipped.diagonal(offset).tobytes()
+
+def count_words_in_grid(grid, words):
+    """
+    Count all occurrences of many words in the grid in all directions in one pass.
+    Every word and its reverse go into one Aho-Corasick automaton, which then
+    reads each row, column and diagonal once. A reversed match is a match in
+    the opposite direction, so each word's count equals count_word_in_grid.
+
+    Returns:
+        dict: Word to number of occurrences.
+    """
+    encoded = {word: word.encode() for word in words}
+    automaton = AhoCorasick([pattern for word in encoded.values() for pattern in (word, word[::-1])])
+    hits = automaton.count(grid_lines(grid))
+    return {word: hits[pattern] + hits[pattern[::-1]] for word, pattern in encoded.items()}
+
 def read_input_file(file_path):
-    """Read the input file and return the grid as a list of strings."""
-    with open(file_path, 'r') as f:
-        return [line.strip() for line in f]
+    """Read the input file and return the grid."""
+    return Grid.from_file(file_path)
 
-def main():
-    """Main function to read input, process the word search, and calculate the result."""
-    input_file = Path(__file__).parent / 'input.txt'
+def solve(input_file):
+    """Count XMAS words (Part 1) and X-MAS patterns (Part 2) in the grid."""
     grid = read_input_file(input_file)
     word = "XMAS"
 
+    # Large grids use the NumPy engine, small ones the pure-Python one
+    if grid.rows * grid.cols >= NUMPY_THRESHOLD:
+        return count_word_in_grid_numpy(grid, word), count_xmas_in_grid_numpy(grid)
+
     # Count occurrences of the word in the grid
     total_occurrences = count_word_in_grid(grid, word)
-    print("Total occurrences of the word XMAS:", total_occurrences)
 
     # Part 2: Count occurrences of X-MAS patterns
     xmas_occurrences = count_xmas_in_grid(grid)
+
+    return total_occurrences, xmas_occurrences
+
+def main():
+    """Main function to read input, process the word search, and calculate the result."""
+    input_file = Path(__file__).parent / 'input.txt'
+
+    total_occurrences, xmas_occurrences = solve(input_file)
+    print("Total occurrences of the word XMAS:", total_occurrences)
     print("Total occurrences of X-MAS patterns:", xmas_occurrences) 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import heapq
 import os
 from pathlib import Path
 
@@ -5,6 +6,7 @@ def is_update_valid(ordering, update):
     """
     Checks if the given update is valid based on the ordering rules.
     An update is valid if all dependencies of a page appear before it in the update.
+    Compiles the rules on every call; use RuleSet directly for many updates.
 
     Args:
         ordering (dict): Dependency rules where key depends on the values in the list.
@@ -13,20 +15,12 @@ def is_update_valid(ordering, update):
     Returns:
         bool: True if the update is valid, False otherwise.
     """
-    for i, curr_value in enumerate(update):
-        # Find indices of dependencies for the current page in the update
-        indices = [update.index(num) for num in ordering.get(curr_value, []) if num in update]
-
-        # If any dependency appears later in the update, return False
-        if any(i >= index for index in indices):
-            return False
-
-    return True
+    return RuleSet(ordering).is_valid(update)
 
 def modify_update(ordering, update):
     """
-    Reorders the given update based on the ordering rules using a set and a result list.
-    The middle page of the corrected update is returned.
+    Reorders the given update based on the ordering rules and returns its middle page.
+    Compiles the rules on every call; use RuleSet directly for many updates.
 
     Args:
         ordering (dict): Dependency rules where key depends on the values in the list.
@@ -34,22 +28,284 @@ def modify_update(ordering, update):
 
     Returns:
         int: The middle page value of the corrected update.
+
+    Raises:
+        ValueError: If the rules between the update's pages form a cycle.
+    """
+    corrected = RuleSet(ordering).sort(update)
+    return corrected[len(corrected) // 2]
+
+class RuleSet:
     """
-    sorted_update = []
-    update_set = set(update)  # Convert update to a set for fast lookup
-    added = set()  # Tracks pages already added to the sorted update
+    Ordering rules compiled once for validating and sorting many updates.
+
+    Attributes:
+        successors (dict): Page to the set of pages that must come after it.
+    """
+
+    def __init__(self, ordering):
+        """
+        Compiles the ordering rules.
+
+        Args:
+            ordering (dict): Dependency rules where key depends on the values in the list.
+        """
+        self.successors = {page: set(seconds) for page, seconds in ordering.items()}
+
+    def is_valid(self, update):
+        """
+        Checks an update in one pass: no page may have a successor among the pages before it.
 
-    # Reorder pages based on their dependencies
-    while len(sorted_update) < len(update):
+        Args:
+            update (list): The update sequence to validate.
+
+        Returns:
+            bool: True if the update is valid, False otherwise.
+        """
+        seen = set()
+        empty = frozenset()
         for page in update:
-            if page not in added:
-                # Add page if all its dependencies are already in sorted_update
-                if page not in ordering or all(dep in added for dep in ordering[page] if dep in update_set):
-                    sorted_update.append(page)
-                    added.add(page)
+            # isdisjoint walks the smaller of the two sets
+            if not self.successors.get(page, empty).isdisjoint(seen):
+                return False
+            seen.add(page)
+        return True
+
+    def sort(self, update):
+        """
+        Orders an update with Kahn's algorithm, using only the rules between its own pages.
+        Among the pages whose predecessors are all placed, the one earliest in the update
+        goes next, so the result is the valid order closest to the original: the first
+        page that can go first stays first, and so on. An update that already follows
+        the rules is returned unchanged.
+
+        Args:
+            update (list): The update sequence to correct.
+
+        Returns:
+            list: The corrected update.
+
+        Raises:
+            ValueError: If the rules between the update's pages form a cycle.
+        """
+        pages = set(update)
+        empty = frozenset()
+        edges = {page: [s for s in self.successors.get(page, empty) if s in pages] for page in update}
+        in_degree = dict.fromkeys(update, 0)
+        for successors in edges.values():
+            for successor in successors:
+                in_degree[successor] += 1
+
+        # Ready pages are kept in a heap of their positions in the update
+        position = {page: i for i, page in enumerate(update)}
+        ready = [i for i, page in enumerate(update) if in_degree[page] == 0]
+        result = []
+        while ready:
+            page = update[heapq.heappop(ready)]
+            result.append(page)
+            for successor in edges[page]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    heapq.heappush(ready, position[successor])
+
+        if len(result) < len(update):
+            stuck = [page for page in update if in_degree[page] > 0]
+            raise ValueError(f"Ordering rules form a cycle among pages {stuck}")
+        return result
+
+class BitsetRules:
+    """
+    Ordering rules packed into one bitmask per page, for validating large batches of updates.
+    Each page gets a bit, and each page's mask holds the bits of the pages that must come
+    after it (or before it), so checking a page against every earlier page is one AND.
+
+    Attributes:
+        bits (dict): Page to its single-bit mask.
+        after (dict): Page to the mask of pages that must come after it.
+        before (dict): Page to the mask of pages that must come before it.
+        rules (RuleSet): The same rules, used to sort updates the masks cannot order alone.
+    """
+
+    def __init__(self, ordering):
+        """
+        Packs the ordering rules.
+
+        Args:
+            ordering (dict): Dependency rules where key depends on the values in the list.
+        """
+        self.bits = {}
+        self.after = {}
+        self.before = {}
+        for first, seconds in ordering.items():
+            for second in seconds:
+                self.after[first] = self.after.get(first, 0) | self.bit(second)
+                self.before[second] = self.before.get(second, 0) | self.bit(first)
+        self.rules = RuleSet(ordering)
+
+    def bit(self, page):
+        """
+        Returns the bit of a page, assigning the next free one to new pages.
+        """
+        if page not in self.bits:
+            self.bits[page] = 1 << len(self.bits)
+        return self.bits[page]
+
+    def is_valid(self, update):
+        """
+        Checks that no page must come before any of the pages already seen.
+        """
+        after = self.after
+        bits = self.bits
+        seen = 0
+        for page in update:
+            if after.get(page, 0) & seen:
+                return False
+            seen |= bits.get(page, 0)
+        return True
+
+    def corrected_middle(self, update):
+        """
+        Returns the middle page of the corrected update.
+
+        When the rules order every pair of pages in the update, each page's position is
+        the number of its predecessors in the update, so no sort is needed. Otherwise the
+        update is sorted with Kahn's algorithm.
+        """
+        bits = self.bits
+        before = self.before
+        pages = 0
+        for page in update:
+            pages |= bits.get(page, 0)
+
+        ordered = [None] * len(update)
+        for page in update:
+            ordered[bin(before.get(page, 0) & pages).count('1')] = page  # int.bit_count needs 3.10
+
+        if None in ordered or not self.is_valid(ordered):
+            ordered = self.rules.sort(update)
+        return ordered[len(ordered) // 2]
+
+class IncrementalUpdates:
+    """
+    Keeps both sums current while ordering rules are added and removed.
+
+    A rule between pages a and b can only change the updates holding both pages. Each
+    page keeps the set of updates it appears in, so those updates are the intersection
+    of two sets. Only they are revalidated and re-sorted, and their old contributions
+    are swapped for the new ones in the running sums.
+
+    Attributes:
+        rules (RuleSet): The current rules.
+        updates (list): The updates, which never change.
+        part_1_sum (int): Sum of the middle pages of the valid updates.
+        part_2_sum (int): Sum of the middle pages of the corrected invalid updates.
+    """
+
+    def __init__(self, ordering, updates):
+        """
+        Validates every update once and indexes the updates by page.
+
+        Args:
+            ordering (dict): Dependency rules where key depends on the values in the list.
+            updates (list): The updates to validate and correct.
+        """
+        self.rules = RuleSet(ordering)
+        self.updates = updates
+        self.updates_with_page = {}
+        for i, update in enumerate(updates):
+            for page in update:
+                self.updates_with_page.setdefault(page, set()).add(i)
 
-    # Return the middle page of the corrected update
-    return sorted_update[len(sorted_update) // 2]
+        self.part_1_sum = 0
+        self.part_2_sum = 0
+        self._contributions = [self._contribution(update) for update in updates]
+        for part_1, part_2 in self._contributions:
+            self.part_1_sum += part_1
+            self.part_2_sum += part_2
+
+    def _contribution(self, update):
+        """
+        Returns what an update adds to the Part 1 and Part 2 sums under the current rules.
+        """
+        if self.rules.is_valid(update):
+            return update[len(update) // 2], 0
+        corrected = self.rules.sort(update)
+        return 0, corrected[len(corrected) // 2]
+
+    def affected_updates(self, first, second):
+        """
+        Returns the indices of the updates holding both pages.
+        """
+        empty = frozenset()
+        return self.updates_with_page.get(first, empty) & self.updates_with_page.get(second, empty)
+
+    def _refresh(self, first, second):
+        """
+        Recomputes the updates affected by a rule change and adjusts the sums.
+        Nothing changes if an affected update can no longer be sorted.
+        """
+        affected = self.affected_updates(first, second)
+        contributions = {i: self._contribution(self.updates[i]) for i in affected}
+        for i, (part_1, part_2) in contributions.items():
+            old_part_1, old_part_2 = self._contributions[i]
+            self.part_1_sum += part_1 - old_part_1
+            self.part_2_sum += part_2 - old_part_2
+            self._contributions[i] = part_1, part_2
+
+    def add_rule(self, first, second):
+        """
+        Adds the rule that first must come before second.
+
+        Raises:
+            ValueError: If the new rule closes a cycle within an update; the rule is not added.
+        """
+        successors = self.rules.successors.setdefault(first, set())
+        if second in successors:
+            return
+        successors.add(second)
+        try:
+            self._refresh(first, second)
+        except ValueError:
+            successors.discard(second)
+            raise
+
+    def remove_rule(self, first, second):
+        """
+        Removes the rule that first must come before second.
+        """
+        successors = self.rules.successors.get(first)
+        if not successors or second not in successors:
+            raise ValueError(f"Rule {first}|{second} does not exist")
+        successors.discard(second)
+        self._refresh(first, second)
+
+def read_rules(f):
+    """
+    Reads ordering rules from an open input file, up to and including the blank line.
+
+    Args:
+        f (file): The input file, positioned at its start.
+
+    Returns:
+        dict: Dependency rules where key depends on the values in the list.
+    """
+    ordering = {}
+    for line in f:
+        line = line.strip()
+        if not line:
+            break  # Empty line separates rules from updates
+        first, second = map(int, line.split('|'))
+        ordering.setdefault(first, []).append(second)
+    return ordering
+
+def iter_updates(f):
+    """
+    Yields the updates remaining in an open input file, one list of pages at a time.
+    """
+    for line in f:
+        line = line.strip()
+        if line:
+            yield list(map(int, line.split(',')))
 
 def read_input_file(file_path):
     """
@@ -63,48 +319,49 @@ def read_input_file(file_path):
             - ordering (dict): Dependency rules where key depends on the values in the list.
             - updates (list): List of updates to validate and correct.
     """
-    ordering = {}
-    updates = []
-
     with open(file_path, 'r') as f:
-        getting_ordering = True  # Flag to distinguish ordering rules and updates
-
-        for line in f:
-            line = line.strip()
-            if not line:
-                getting_ordering = False  # Empty line separates rules from updates
-            elif getting_ordering:
-                # Parse ordering rules
-                first, second = map(int, line.split('|'))
-                ordering.setdefault(first, []).append(second)
-            else:
-                # Parse updates
-                updates.append(list(map(int, line.split(','))))
+        ordering = read_rules(f)
+        updates = list(iter_updates(f))
 
     return ordering, updates
 
-def main():
-    """
-    Main function to process the input file and compute sums for Part 1 and Part 2.
+def solve(input_file):
     """
-    # Define the input file path
-    input_file = Path(__file__).parent / 'input.txt'
+    Computes the middle-page sums of the valid updates (Part 1) and the corrected updates (Part 2).
+    The updates are streamed from the file, so only one is held in memory at a time.
 
-    # Read and parse the input data
-    ordering, updates = read_input_file(input_file)
+    Args:
+        input_file (Path): Path to the input file.
 
+    Returns:
+        tuple: The Part 1 and Part 2 sums.
+    """
     # Initialize sums for Part 1 and Part 2
     part_1_sum = 0
     part_2_sum = 0
 
-    # Process each update
-    for update in updates:
-        if is_update_valid(ordering, update):
-            # If valid, add the middle page value to Part 1 sum
-            part_1_sum += update[len(update) // 2]
-        else:
-            # If invalid, correct it and add the middle page value to Part 2 sum
-            part_2_sum += modify_update(ordering, update)
+    with open(input_file, 'r') as f:
+        rules = BitsetRules(read_rules(f))
+
+        # Process each update
+        for update in iter_updates(f):
+            if rules.is_valid(update):
+                # If valid, add the middle page value to Part 1 sum
+                part_1_sum += update[len(update) // 2]
+            else:
+                # If invalid, correct it and add the middle page value to Part 2 sum
+                part_2_sum += rules.corrected_middle(update)
+
+    return part_1_sum, part_2_sum
+
+def main():
+    """
+    Main function to process the input file and compute sums for Part 1 and Part 2.
+    """
+    # Define the input file path
+    input_file = Path(__file__).parent / 'input.txt'
+
+    part_1_sum, part_2_sum = solve(input_file)
 
     # Print the results
     print(f"Part 1 Sum: {part_1_sum}")
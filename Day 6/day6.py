@@ -1,110 +1,334 @@
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-import copy
 from tqdm import tqdm
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.grid import MappedGrid
+
+OBSTACLE = ord('#')
+
+# Candidates per worker task, and the candidate count from which a process pool is used
+CHUNK_CANDIDATES = 2_000
+PARALLEL_THRESHOLD = 20_000
+
+# Per-worker state set up by _init_worker: the jump tables attached from shared memory,
+# the visited-state buffer reused by every chunk, and the last epoch used in it
+_worker_shm = None
+_worker_jumps = None
+_worker_stop_cells = None
+_worker_seen = None
+_worker_epoch = 0
+
 def read_input_file(file_path):
     """
-    Reads the input file and returns the grid as a list of lists.
+    Memory-maps the input file and returns it as a read-only grid.
     """
-    with open(file_path, 'r') as f:
-        return [list(line.strip()) for line in f]
+    return MappedGrid.from_file(file_path)
 
-def on_grid(location, grid):
+def change_direction_90(direction):
     """
-    Checks if the given location is within the boundaries of the grid.
+    Rotates the direction 90 degrees clockwise.
+    Directions are indices into grid.orthogonal_offsets: 0 up, 1 right, 2 down, 3 left.
     """
-    return 0 <= location[0] < len(grid) and 0 <= location[1] < len(grid[0])
+    return (direction + 1) % 4
 
-def change_direction_90(direction):
+def build_jump_tables(grid):
     """
-    Rotates the direction 90 degrees clockwise.
+    Precomputes where the guard ends up when walking straight from any cell.
+
+    The guard only ever turns on a cell directly in front of an obstacle, so each such
+    (cell, direction) pair is numbered as a turn slot. For each direction, the jump table
+    maps the flat index of a cell to the slot where the guard next turns. If there is no
+    obstacle before the edge, it holds ~edge (a negative value), where edge is the last
+    cell before the guard leaves the grid. The stop cell of each slot follows the four
+    tables in the same array.
+
+    Values are int32 whenever they fit, so the tables take 16 bytes per cell.
+
+    Returns:
+        np.ndarray: 1D array of 4 * rows * stride jump entries, one block per direction
+                    indexed by flat index (newline slots are unused), followed by the
+                    stop cell of every turn slot.
     """
-    directions = {'up': 'right', 'right': 'down', 'down': 'left', 'left': 'up'}
-    return directions[direction]
+    blocked = grid.to_numpy() == OBSTACLE
+    rows, cols = blocked.shape
+    s = grid.stride
+    size = rows * s
+    r = np.arange(rows)[:, None]
+    c = np.arange(cols)[None, :]
+
+    def strictly_before(nearest, fill, axis):
+        # Shift the running nearest-obstacle arrays by one, so a cell never sees itself
+        shifted = np.full_like(nearest, fill)
+        if axis == 0:
+            shifted[1:] = nearest[:-1]
+        else:
+            shifted[:, 1:] = nearest[:, :-1]
+        return shifted
+
+    # Nearest obstacle row above / column left of each cell, or -1
+    above = strictly_before(np.maximum.accumulate(np.where(blocked, r, -1), axis=0), -1, 0)
+    left = strictly_before(np.maximum.accumulate(np.where(blocked, c, -1), axis=1), -1, 1)
+
+    # Nearest obstacle row below / column right of each cell, or rows / cols (computed flipped)
+    below = strictly_before(np.minimum.accumulate(np.where(blocked, r, rows)[::-1], axis=0), rows, 0)[::-1]
+    right = strictly_before(np.minimum.accumulate(np.where(blocked, c, cols)[:, ::-1], axis=1), cols, 1)[:, ::-1]
+
+    # Cells in front of an obstacle when facing up, right, down and left
+    open_cells = ~blocked
+    fronts = [np.zeros_like(blocked) for _ in range(4)]
+    fronts[0][1:] = open_cells[1:] & blocked[:-1]
+    fronts[1][:, :-1] = open_cells[:, :-1] & blocked[:, 1:]
+    fronts[2][:-1] = open_cells[:-1] & blocked[1:]
+    fronts[3][:, 1:] = open_cells[:, 1:] & blocked[:, :-1]
+
+    num_slots = sum(int(front.sum()) for front in fronts)
+    dtype = np.int32 if max(size, num_slots) < 2 ** 31 else np.int64
+    result = np.full(4 * size + num_slots, -1, dtype=dtype)
+    tables = result[:4 * size].reshape(4, rows, s)
+    stop_cells = result[4 * size:]
+
+    # Number the turn slots and record their stop cells
+    slots = np.full((4, rows, cols), -1, dtype=dtype)
+    first_slot = 0
+    for d, front in enumerate(fronts):
+        front_r, front_c = np.nonzero(front)
+        slots[d][front_r, front_c] = np.arange(first_slot, first_slot + front_r.size)
+        stop_cells[first_slot:first_slot + front_r.size] = front_r * s + front_c
+        first_slot += front_r.size
+
+    # Row and column of the stop cell reached from every cell, and whether the guard exits instead
+    stops = (
+        (above < 0, above + 1, np.broadcast_to(c, blocked.shape), ~np.broadcast_to(c, blocked.shape)),
+        (right >= cols, np.broadcast_to(r, blocked.shape), right - 1, ~(r * s + cols - 1)),
+        (below >= rows, below - 1, np.broadcast_to(c, blocked.shape), ~((rows - 1) * s + c)),
+        (left < 0, np.broadcast_to(r, blocked.shape), left + 1, ~(r * s)),
+    )
+    for d, (exits, stop_r, stop_c, edge) in enumerate(stops):
+        turn = slots[d][np.where(exits, 0, stop_r), np.where(exits, 0, stop_c)]
+        tables[d][:, :cols] = np.where(exits, edge, turn)
 
-def calculate_next_location(location, direction):
+    return result
+
+def jump_views(buffer, size, typecode):
+    """
+    Splits a buffer laid out by build_jump_tables into one memoryview per direction
+    plus a memoryview of the turn slots' stop cells. Indexing a memoryview returns
+    plain ints, as fast as a list but without a copy.
+
+    Args:
+        buffer: The tables, or shared memory holding a copy of them.
+        size (int): Number of flat indices (rows * stride).
+        typecode (str): 'i' for int32 tables, 'q' for int64 ones.
+
+    Returns:
+        tuple: The list of four jump tables and the stop cells.
+    """
+    view = memoryview(buffer).cast('B').cast(typecode)
+    return [view[d * size:(d + 1) * size] for d in range(4)], view[4 * size:]
+
+def typecode_of(tables):
     """
-    Calculates the next location based on the current direction.
+    Returns the memoryview typecode of tables built by build_jump_tables.
     """
-    deltas = {'up': (-1, 0), 'right': (0, 1), 'down': (1, 0), 'left': (0, -1)}
-    delta = deltas[direction]
-    return (location[0] + delta[0], location[1] + delta[1])
+    return 'i' if tables.dtype == np.int32 else 'q'
 
-def is_loop(grid, location, direction):
+def iter_path(jumps, stop_cells, stride, location, direction):
     """
-    Checks if adding an obstacle at the current position causes the guard to enter a loop.
+    Yields every step of the guard's patrol as (location, direction, next cell), where
+    location and direction are the guard's state just before it enters next cell.
     """
-    visited_states = set()
+    offsets = (-stride, 1, stride, -1)
 
     while True:
-        state = (location, direction)
-        if state in visited_states:
-            return True
-        visited_states.add(state)
+        target = jumps[direction][location]
+        end = stop_cells[target] if target >= 0 else ~target
+        step = offsets[direction]
+        for cell in range(location + step, end + step, step):
+            yield cell - step, direction, cell
 
-        next_location = calculate_next_location(location, direction)
+        if target < 0:
+            return
+        location = end
+        direction = change_direction_90(direction)
 
-        if not on_grid(next_location, grid):
-            return False
+def is_loop(jumps, stop_cells, stride, location, direction, obstacle, seen, epoch):
+    """
+    Checks if adding an obstacle at the given flat index traps the guard in a loop.
+    The guard jumps from turn to turn, so this costs O(turns) rather than O(cells walked).
+    The added obstacle is never written to the grid: each jump checks whether it lies
+    between the guard and the stop on the current row or column.
 
-        if grid[next_location[0]][next_location[1]] == '#':
-            direction = change_direction_90(direction)
+    Args:
+        seen (array): Visited-state buffer with one entry per turn slot, plus one per
+            direction for turning in front of the added obstacle. A state is visited
+            when its entry equals epoch, so each check starts with a new epoch instead
+            of clearing the buffer.
+        epoch (int): Marker for this check, different from every earlier one.
+    """
+    offsets = (-stride, 1, stride, -1)
+    obstacle_col = obstacle % stride
+    obstacle_row = obstacle // stride
+    added_slots = len(stop_cells)
+
+    while True:
+        slot = jumps[direction][location]
+        end = stop_cells[slot] if slot >= 0 else ~slot
+
+        # The added obstacle cuts the jump short if it lies on this stretch of path
+        if direction % 2 == 0:
+            same_line = location % stride == obstacle_col
         else:
-            location = next_location
+            same_line = location // stride == obstacle_row
+        if same_line and (location < obstacle <= end or end <= obstacle < location):
+            end = obstacle - offsets[direction]
+            slot = added_slots + direction
+        elif slot < 0:
+            return False
 
-def main():
+        if seen[slot] == epoch:
+            return True
+        seen[slot] = epoch
+
+        location = end
+        direction = change_direction_90(direction)
+
+def find_candidates(jumps, stop_cells, stride, location, direction):
     """
-    Main function to compute solutions for Part 1 and Part 2.
+    Walks the patrol once and returns the visited cells and the obstruction candidates.
+
+    An obstruction only changes the patrol from the first time the guard would enter its
+    cell, so each candidate is (location, direction, cell) with the guard's state just
+    before that first entry. Checking from there replays nothing of the path before it.
+
+    Returns:
+        tuple: The set of visited cells and the list of candidates.
     """
-    # Define the input file path
-    input_file = Path(__file__).parent / 'input.txt'
+    visited = {location}
+    candidates = []
+    for before, heading, cell in iter_path(jumps, stop_cells, stride, location, direction):
+        if cell not in visited:
+            visited.add(cell)
+            candidates.append((before, heading, cell))
+    return visited, candidates
 
-    # Read and parse the input data
-    grid = read_input_file(input_file)
+def new_seen_buffer(stop_cells):
+    """
+    Returns a cleared visited-state buffer for is_loop.
+    """
+    return array('i', bytes(4 * (len(stop_cells) + 4)))
 
-    # Initial guard direction
-    init_direction = 'up'
+def count_loops(jumps, stop_cells, stride, candidates, seen=None, first_epoch=1):
+    """
+    Counts the candidates whose obstruction traps the guard in a loop.
 
-    # Locate the guard's starting position ('^')
-    for r, row in enumerate(grid):
-        for c, char in enumerate(row):
-            if char == '^':
-                init_location = (r, c)
-                break
-        else:
-            continue
-        break
+    Args:
+        seen (array): Visited-state buffer to reuse (see is_loop). A new one is
+            allocated if not given.
+        first_epoch (int): Epoch of the first candidate; the candidates use consecutive
+            epochs from there, which must all be newer than any already in seen.
+    """
+    if seen is None:
+        seen = new_seen_buffer(stop_cells)
+    num_loops = 0
+    for epoch, (location, direction, obstacle) in enumerate(candidates, first_epoch):
+        if is_loop(jumps, stop_cells, stride, location, direction, obstacle, seen, epoch):
+            num_loops += 1
+    return num_loops
 
-    # Part 1: Simulate the guard's patrol path
-    location = init_location
-    direction = init_direction
-    visited_spaces = set()
-    visited_spaces.add(location)
+def _init_worker(shm_name, nbytes, size, typecode):
+    """
+    Attaches a worker process to the jump tables published in shared memory.
+    The block may be rounded up to a whole page, so only its first nbytes are used.
+    """
+    global _worker_shm, _worker_jumps, _worker_stop_cells, _worker_seen, _worker_epoch
+    _worker_shm = SharedMemory(name=shm_name)
+    _worker_jumps, _worker_stop_cells = jump_views(_worker_shm.buf[:nbytes], size, typecode)
+    _worker_seen = new_seen_buffer(_worker_stop_cells)
+    _worker_epoch = 0
 
-    while True:
-        next_location = calculate_next_location(location, direction)
+def _count_loops_chunk(stride, candidates):
+    """
+    Counts the loops among a chunk of candidates in a worker process.
+    The worker's visited-state buffer is reused, with epochs continuing from the last chunk.
+    """
+    global _worker_epoch
+    num_loops = count_loops(_worker_jumps, _worker_stop_cells, stride, candidates, _worker_seen,
+                            _worker_epoch + 1)
+    _worker_epoch += len(candidates)
+    return num_loops, len(candidates)
+
+def count_loops_parallel(tables, size, stride, candidates, max_workers=None, chunk_candidates=CHUNK_CANDIDATES):
+    """
+    Counts the loop-causing candidates in worker processes.
 
-        if not on_grid(next_location, grid):
-            break
+    The jump tables are copied once into shared memory, which every worker attaches to
+    instead of receiving a pickled copy. Each task is a chunk of candidates and returns
+    only its count, and progress advances once per finished chunk.
+    """
+    shm = SharedMemory(create=True, size=tables.nbytes)
+    try:
+        np.ndarray(tables.shape, dtype=tables.dtype, buffer=shm.buf)[:] = tables
+        num_loops = 0
 
-        if grid[next_location[0]][next_location[1]] == '#':
-            direction = change_direction_90(direction)
-        else:
-            location = next_location
-            visited_spaces.add(location)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(shm.name, tables.nbytes, size, typecode_of(tables))) as executor:
+            futures = [
+                executor.submit(_count_loops_chunk, stride, candidates[start:start + chunk_candidates])
+                for start in range(0, len(candidates), chunk_candidates)
+            ]
+            with tqdm(total=len(candidates), desc="Completing Part 2") as progress:
+                for future in as_completed(futures):
+                    loops, checked = future.result()
+                    num_loops += loops
+                    progress.update(checked)
+    finally:
+        shm.close()
+        shm.unlink()
 
-    print(f"Part 1 Solution: {len(visited_spaces)}")
+    return num_loops
 
-    # Part 2: Find possible positions to place an obstruction, where obstructions can only be put on guard's path
-    visited_spaces.remove(init_location)
-    num_loops = 0
+def solve(input_file):
+    """
+    Computes the number of cells the guard visits (Part 1) and the number of
+    obstruction positions that trap the guard in a loop (Part 2).
+    """
+    # Read and parse the input data
+    grid = read_input_file(input_file)
+    size = grid.rows * grid.stride
+    tables = build_jump_tables(grid)
+    jumps, stop_cells = jump_views(tables, size, typecode_of(tables))
 
-    for space in tqdm(visited_spaces, desc="Completing Part 2"):
-        tmp_grid = copy.deepcopy(grid)
-        tmp_grid[space[0]][space[1]] = '#'
-        if is_loop(tmp_grid, init_location, init_direction):
-            num_loops += 1
+    # Locate the guard's starting position ('^'), facing up
+    init_location = grid.find('^')
+    init_direction = 0
+
+    # Part 1: Walk the guard's patrol path once, recording where an obstruction could first be met
+    visited_spaces, candidates = find_candidates(jumps, stop_cells, grid.stride, init_location, init_direction)
+    part_1 = len(visited_spaces)
+
+    # Part 2: Resume the patrol just before each candidate with the obstruction in place
+    if len(candidates) >= PARALLEL_THRESHOLD:
+        num_loops = count_loops_parallel(tables, size, grid.stride, candidates)
+    else:
+        num_loops = count_loops(jumps, stop_cells, grid.stride, candidates)
+
+    return part_1, num_loops
+
+def main():
+    """
+    Main function to compute solutions for Part 1 and Part 2.
+    """
+    # Define the input file path
+    input_file = Path(__file__).parent / 'input.txt'
 
+    part_1, num_loops = solve(input_file)
+    print(f"Part 1 Solution: {part_1}")
     print(f"Part 2 Solution: {num_loops}")
 
 if __name__ == "__main__":
@@ -1,6 +1,22 @@
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from itertools import product
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.parsing import csr_to_lists, read_labelled_int_rows
+
+# Operator sets for Part 1 and Part 2
+PART_1_OPERATORS = ('+', '*')
+PART_2_OPERATORS = ('+', '*', '||')
+
+# Equations per worker task, and the equation count from which a process pool is used
+CHUNK_EQUATIONS = 50_000
+PARALLEL_THRESHOLD = 200_000
+
 def read_input_file(file_path):
     """
     Reads the input file and parses the data into two arrays:
@@ -15,15 +31,8 @@ def read_input_file(file_path):
                - outputs (list of int): Target output values.
                - inputs (list of list of int): Input numbers for each target output.
     """
-    outputs, inputs = [], []
-
-    with open(file_path, 'r') as f:
-        for line in f:
-            output, input_numbers = int(line.split(": ")[0]), [int(x) for x in line.split(": ")[1].split()]
-            outputs.append(output)
-            inputs.append(input_numbers)
-
-    return outputs, inputs
+    outputs, values, offsets = read_labelled_int_rows(file_path)
+    return outputs.tolist(), csr_to_lists(values, offsets)
 
 
 def is_valid(output, inputs):
@@ -60,22 +69,226 @@ def is_valid(output, inputs):
     return False
 
 
+def check_operators(operators):
+    """
+    Returns the (add, multiply, concatenate) flags of an operator set.
+    """
+    unknown = set(operators) - set(PART_2_OPERATORS)
+    if unknown:
+        raise ValueError(f"Unsupported operators: {sorted(unknown)}")
+    return '+' in operators, '*' in operators, '||' in operators
+
+
+def digit_powers(inputs):
+    """
+    Returns 10 ** (number of digits) of each input, so that a || b == a * power + b.
+    """
+    powers = []
+    for value in inputs:
+        power = 10
+        while power <= value:
+            power *= 10
+        powers.append(power)
+    return powers
+
+
+def can_produce(output, inputs, operators=PART_2_OPERATORS):
+    """
+    Determines if the operators, applied left-to-right on the inputs, can produce the
+    target output, by undoing the operators from the last input backwards.
+
+    Operators are evaluated left to right, so the last one applied is the outermost. A
+    target t ending in input x can only come from t - x (if that is non-negative),
+    t / x (if the division is exact) or from cutting x's digits off the end of t (if
+    t ends with them). Every other branch is pruned, which is far cheaper than trying
+    every combination of operators.
+
+    Args:
+        output (int): The target output value.
+        inputs (list of int): The non-negative input numbers to evaluate.
+        operators (tuple of str): The allowed operators, among '+', '*' and '||'.
+
+    Returns:
+        bool: True if the target output can be produced, otherwise False.
+    """
+    add, multiply, concatenate = check_operators(operators)
+    powers = digit_powers(inputs)
+
+    def search(target, i):
+        value = inputs[i]
+        if i == 0:
+            return target == value
+        if add and target >= value and search(target - value, i - 1):
+            return True
+        if multiply:
+            if value == 0:
+                if target == 0:
+                    return True  # Anything times zero
+            elif target % value == 0 and search(target // value, i - 1):
+                return True
+        if concatenate and target % powers[i] == value and search(target // powers[i], i - 1):
+            return True
+        return False
+
+    return bool(inputs) and search(output, len(inputs) - 1)
+
+
+def can_produce_forward(output, inputs, operators=PART_2_OPERATORS):
+    """
+    Determines if the operators can produce the target output by searching forwards
+    from the first input, as is_valid does, but without enumerating every combination.
+
+    None of the operators makes a partial result smaller (unless a later input is a zero
+    multiplier), so a branch is dropped as soon as it exceeds the target. Different
+    operator prefixes often reach the same partial result, so each (position, value)
+    state is explored only once.
+
+    Args:
+        output (int): The target output value.
+        inputs (list of int): The non-negative input numbers to evaluate.
+        operators (tuple of str): The allowed operators, among '+', '*' and '||'.
+
+    Returns:
+        bool: True if the target output can be produced, otherwise False.
+    """
+    add, multiply, concatenate = check_operators(operators)
+    if not inputs:
+        return False
+    powers = digit_powers(inputs)
+    last = len(inputs) - 1
+    cut_off = not (multiply and 0 in inputs[1:])
+
+    explored = set()
+    stack = [(0, inputs[0])]
+    while stack:
+        state = stack.pop()
+        i, value = state
+        if i == last:
+            if value == output:
+                return True
+            continue
+        if state in explored:
+            continue
+        explored.add(state)
+
+        operand = inputs[i + 1]
+        candidates = []
+        if add:
+            candidates.append(value + operand)
+        if multiply:
+            candidates.append(value * operand)
+        if concatenate:
+            candidates.append(value * powers[i + 1] + operand)
+        for candidate in candidates:
+            if not cut_off or candidate <= output:
+                stack.append((i + 1, candidate))
+
+    return False
+
+
+def evaluate_equations(outputs, values, offsets, solver=can_produce):
+    """
+    Evaluates equations given in CSR form and times each one.
+
+    Args:
+        outputs (np.ndarray): Target output of each equation.
+        values (np.ndarray): All input numbers in equation order.
+        offsets (np.ndarray): Equation boundaries, so equation i uses values[offsets[i]:offsets[i + 1]].
+        solver (callable): can_produce or can_produce_forward.
+
+    Returns:
+        tuple: The Part 1 and Part 2 totals, and an array with the seconds spent on each equation.
+    """
+    targets = outputs.tolist()
+    timings = np.empty(len(targets))
+    part_1 = part_2 = 0
+
+    # Part 1 operators are a subset of Part 2's, so a Part 1 match counts for both
+    clock = time.perf_counter
+    for i, (output, numbers) in enumerate(zip(targets, csr_to_lists(values, offsets))):
+        start = clock()
+        if solver(output, numbers, PART_1_OPERATORS):
+            part_1 += output
+            part_2 += output
+        elif solver(output, numbers, PART_2_OPERATORS):
+            part_2 += output
+        timings[i] = clock() - start
+
+    return part_1, part_2, timings
+
+
+def evaluate_equations_parallel(outputs, values, offsets, solver=can_produce, max_workers=None,
+                                chunk_equations=CHUNK_EQUATIONS):
+    """
+    Splits CSR equations into chunks along the offsets and evaluates each chunk in a
+    worker process. Returns the same totals and timings as evaluate_equations.
+    """
+    num_equations = len(outputs)
+    part_1 = part_2 = 0
+    timings = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for start in range(0, num_equations, chunk_equations):
+            stop = min(start + chunk_equations, num_equations)
+            chunk_offsets = offsets[start:stop + 1]
+            futures.append(executor.submit(
+                evaluate_equations,
+                outputs[start:stop],
+                values[chunk_offsets[0]:chunk_offsets[-1]],
+                chunk_offsets - chunk_offsets[0],
+                solver,
+            ))
+        for future in futures:
+            chunk_part_1, chunk_part_2, chunk_timings = future.result()
+            part_1 += chunk_part_1
+            part_2 += chunk_part_2
+            timings.append(chunk_timings)
+
+    return part_1, part_2, np.concatenate(timings) if timings else np.empty(0)
+
+
+def evaluate_file(input_file):
+    """
+    Computes both total calibration results and the per-equation timings of an input file.
+    """
+    outputs, values, offsets = read_labelled_int_rows(input_file)
+    if len(outputs) >= PARALLEL_THRESHOLD:
+        return evaluate_equations_parallel(outputs, values, offsets)
+    return evaluate_equations(outputs, values, offsets)
+
+
+def solve(input_file):
+    """
+    Computes the total calibration results with the +, * operators (Part 1) and
+    the +, *, || operators (Part 2) from a single parse of the input.
+
+    Args:
+        input_file (Path): Path to the input file.
+
+    Returns:
+        tuple: The Part 1 and Part 2 total calibration results.
+    """
+    part_1, part_2, _ = evaluate_file(input_file)
+    return part_1, part_2
+
+
 def main():
     """
-    Main function to compute the total calibration result by summing
+    Main function to compute the total calibration results by summing
     all outputs that can be validated using the input numbers.
     """
     # Define the input file path
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read and parse the input data
-    outputs, inputs = read_input_file(input_file)
-
-    # Compute the total calibration result
-    total_calibration_result = sum(output for i, output in enumerate(outputs) if is_valid(output, inputs[i]))
+    part_1, part_2, timings = evaluate_file(input_file)
 
-    # Print the result
-    print(total_calibration_result)
+    # Print the results and the equation that took longest
+    print(f"Part 1: {part_1}")
+    print(f"Part 2: {part_2}")
+    if timings.size:
+        slowest = int(timings.argmax())
+        print(f"Slowest equation: line {slowest + 1} ({timings[slowest] * 1000:.3f} ms)")
 
 
 if __name__ == "__main__":
@@ -1,118 +1,143 @@
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from aoc.grid import MappedGrid
+
 def read_input_file(file_path):
     """
-    Reads the input file and returns the grid as a list of lists.
+    Memory-maps the input file and returns it as a read-only grid.
 
     Args:
         file_path (str): Path to the input file.
 
     Returns:
-        list: Grid represented as a list of lists.
+        MappedGrid: The input grid.
     """
-    with open(file_path, 'r') as f:
-        return [list(line.strip()) for line in f]
+    return MappedGrid.from_file(file_path)
 
 def get_hashmap(grid):
     """
     Creates a hashmap where each unique character in the grid is mapped to its coordinates.
 
     Args:
-        grid (list): The input grid.
+        grid (MappedGrid): The input grid.
 
     Returns:
         dict: A dictionary with characters as keys and a list of their coordinates as values.
     """
+    letters = grid.to_numpy()
+    rows, cols = np.nonzero(letters != ord('.'))  # Ignore empty spaces
     hashmap = {}
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] != '.':  # Ignore empty spaces
-                hashmap.setdefault(grid[i][j], []).append((i, j))
+    for r, c, char in zip(rows.tolist(), cols.tolist(), letters[rows, cols].tolist()):
+        hashmap.setdefault(chr(char), []).append((r, c))
     return hashmap
 
-def valid_coord(grid, i, j):
+def count_antinodes(grid, hashmap):
     """
-    Checks if the given coordinates are within the grid bounds.
+    Computes the number of unique antinode locations for Part 1.
+    The grid is only read. Antinodes are marked in a flat bitmap of the grid's cells,
+    which is counted at the end.
 
     Args:
-        grid (list): The grid.
-        i (int): Row index.
-        j (int): Column index.
+        grid (MappedGrid): The grid.
+        hashmap (dict): Map of characters to their coordinates.
 
     Returns:
-        bool: True if the coordinates are valid, False otherwise.
+        int: Number of unique antinode locations.
     """
-    return 0 <= i < len(grid) and 0 <= j < len(grid[0])
+    rows, cols = grid.rows, grid.cols
+    antinodes = np.zeros(rows * cols, dtype=bool)
+
+    for coordinates in hashmap.values():
+        points = np.array(coordinates, dtype=np.int64)
+
+        # Each antenna a, mirrored through each other antenna b, gives the antinode 2b - a
+        mirrored = 2 * points[None, :, :] - points[:, None, :]
+        mirrored = mirrored[~np.eye(len(points), dtype=bool)]
+        r, c = mirrored[:, 0], mirrored[:, 1]
+        inside = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+        antinodes[r[inside] * cols + c[inside]] = True
 
-def place_antinodes(grid, hashmap):
+    return int(np.count_nonzero(antinodes))
+
+def count_antinodes_part_2(grid, hashmap):
     """
-    Computes the number of unique antinode locations for Part 1.
+    Computes the number of unique antinode locations for Part 2.
+
+    Every grid point on the line through two antennas is an antinode. Each pair's step
+    vector is divided by its gcd, so collinear points between and beyond the antennas
+    are all found. Pairs on the same line share the same reduced step and the same first
+    point on the grid, so each line is marked only once. In the flat bitmap of the grid's
+    cells, the points of a line are evenly spaced, so all lines are marked in one scatter.
 
     Args:
-        grid (list): The grid.
+        grid (MappedGrid): The grid.
         hashmap (dict): Map of characters to their coordinates.
 
     Returns:
         int: Number of unique antinode locations.
     """
-    antinode_locations = set()
-
-    for key, coordinates in hashmap.items():
-        for i in range(len(coordinates)):
-            x, y = coordinates[i]
-            for j in range(i + 1, len(coordinates)):
-                x1, y1 = coordinates[j]
-                dx, dy = x1 - x, y1 - y
-
-                # Calculate potential antinode locations
-                location_1 = (x - dx, y - dy)
-                location_2 = (x1 + dx, y1 + dy)
-
-                # Add valid locations
-                if valid_coord(grid, location_1[0], location_1[1]):
-                    antinode_locations.add(location_1)
-                    if grid[location_1[0]][location_1[1]] == '.': grid[location_1[0]][location_1[1]] = '#'
-                if valid_coord(grid, location_2[0], location_2[1]):
-                    if grid[location_2[0]][location_2[1]] == '.': grid[location_2[0]][location_2[1]] = '#'
-                    antinode_locations.add(location_2)
-
-    return len(antinode_locations)
-
-def place_antinodes_part_2(grid, hashmap):
+    rows, cols = grid.rows, grid.cols
+    antinodes = np.zeros(rows * cols, dtype=bool)
+    unbounded = rows + cols  # More steps than any line on the grid holds
+
+    for coordinates in hashmap.values():
+        points = np.array(coordinates, dtype=np.int64)
+        first, second = np.triu_indices(len(points), k=1)
+        if not first.size:
+            continue
+
+        # Reduced step of each pair, pointing down (or right along a row)
+        step = points[second] - points[first]
+        step //= np.gcd(step[:, 0], step[:, 1])[:, None]
+        step[(step[:, 0] < 0) | ((step[:, 0] == 0) & (step[:, 1] < 0))] *= -1
+        dr, dc = step[:, 0], step[:, 1]
+        r, c = points[first, 0], points[first, 1]
+
+        # Walk back to the first grid point on the line; dr >= 0, so rows bound it only upwards
+        back = np.where(dr > 0, r // np.maximum(dr, 1), unbounded)
+        back = np.minimum(back, np.where(dc > 0, c // np.maximum(dc, 1),
+                                         np.where(dc < 0, (cols - 1 - c) // np.maximum(-dc, 1), unbounded)))
+        r, c = r - back * dr, c - back * dc
+
+        # Number of grid points from there to the other end of the line
+        length = np.where(dr > 0, (rows - 1 - r) // np.maximum(dr, 1), unbounded)
+        length = np.minimum(length, np.where(dc > 0, (cols - 1 - c) // np.maximum(dc, 1),
+                                             np.where(dc < 0, c // np.maximum(-dc, 1), unbounded))) + 1
+
+        # A line is identified by its first point and its reduced step (dr >= 0, -cols < dc < cols)
+        start = r * cols + c
+        key = start * (2 * rows * cols) + dr * (2 * cols) + dc + cols
+        _, distinct = np.unique(key, return_index=True)
+        start, flat_step, length = start[distinct], (dr * cols + dc)[distinct], length[distinct]
+
+        # Mark every point of every distinct line at once: point k of a line is start + k * flat step
+        line_starts = np.cumsum(length) - length
+        k = np.arange(int(length.sum())) - np.repeat(line_starts, length)
+        antinodes[np.repeat(start, length) + k * np.repeat(flat_step, length)] = True
+
+    return int(np.count_nonzero(antinodes))
+
+def solve(input_file):
     """
-    Computes the number of unique antinode locations for Part 2.
+    Computes the number of unique antinode locations for Part 1 and Part 2.
 
     Args:
-        grid (list): The grid.
-        hashmap (dict): Map of characters to their coordinates.
+        input_file (Path): Path to the input file.
 
     Returns:
-        int: Number of unique antinode locations.
+        tuple: The Part 1 and Part 2 antinode counts.
     """
-    antinode_locations = set()
-
-    for key, coordinates in hashmap.items():
-        for i in range(len(coordinates)):
-            x, y = coordinates[i]
-            for j in range(i + 1, len(coordinates)):
-                x1, y1 = coordinates[j]
-                dx, dy = x1 - x, y1 - y
-
-                # Trace antinodes in both directions
-                location_1 = (x, y)
-                location_2 = (x1, y1)
-
-                while valid_coord(grid, location_1[0], location_1[1]):
-                    antinode_locations.add(location_1)
-                    if grid[location_1[0]][location_1[1]] == '.': grid[location_1[0]][location_1[1]] = '#'
-                    location_1 = (location_1[0] - dx, location_1[1] - dy)
+    # Read and parse the input data
+    grid = read_input_file(input_file)
 
-                while valid_coord(grid, location_2[0], location_2[1]):
-                    antinode_locations.add(location_2)
-                    if grid[location_2[0]][location_2[1]] == '.': grid[location_2[0]][location_2[1]] = '#'
-                    location_2 = (location_2[0] + dx, location_2[1] + dy)
+    # Generate hashmap of antenna locations
+    hashmap = get_hashmap(grid)
 
-    return len(antinode_locations)
+    return count_antinodes(grid, hashmap), count_antinodes_part_2(grid, hashmap)
 
 def main():
     """
@@ -121,15 +146,10 @@ def main():
     # Define the input file path
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read and parse the input data
-    grid = read_input_file(input_file)
-
-    # Generate hashmap of antenna locations
-    hashmap = get_hashmap(grid)
-
     # Compute and print results
-    print("Part 1:", place_antinodes(grid.copy(), hashmap))
-    print("Part 2:", place_antinodes_part_2(grid.copy(), hashmap))
+    part_1, part_2 = solve(input_file)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
 if __name__ == "__main__":
     main()
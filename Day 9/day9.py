@@ -1,5 +1,4 @@
 from pathlib import Path
-import subprocess
 
 def read_input_file(file_path):
     """
@@ -113,28 +112,35 @@ def get_checksum_part2(disk):
 
     return checksum
 
-def main():
+def solve(input_file):
     """
-    Main function to compute solutions for Part 1 and Part 2.
+    Computes the compacted disk checksums for Part 1 and Part 2.
     """
-    # Clear the terminal
-    subprocess.run(["cls"], shell=True)
-
-    # Define the input file path
-    input_file = Path(__file__).parent / 'input.txt'
-
     # Read and parse the input data
     line = read_input_file(input_file)
 
     # Part 1
     disk = build_disk(line)
     modified_disk = rearrange_disk(disk)
-    print('Part 1:', get_checksum(modified_disk))
+    part_1 = get_checksum(modified_disk)
 
     # Part 2
     disk, empty_spaces = build_disk_part2(line)
     modified_disk, _ = rearrange_disk_part2(disk, empty_spaces)
-    print('Part 2:', get_checksum_part2(modified_disk))
+    part_2 = get_checksum_part2(modified_disk)
+
+    return part_1, part_2
+
+def main():
+    """
+    Main function to compute solutions for Part 1 and Part 2.
+    """
+    # Define the input file path
+    input_file = Path(__file__).parent / 'input.txt'
+
+    part_1, part_2 = solve(input_file)
+    print('Part 1:', part_1)
+    print('Part 2:', part_2)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Shared helpers for the Advent of Code 2024 solutions.
+
+Each day lives in its own "Day N" directory and stays runnable on its own
+with `python dayN.py`. This package holds the code shared between days,
+including the runner that executes many days at once:
+
+    python -m aoc            # run every day
+    python -m aoc 1 2 5-9    # run a selection of days
+"""
@@ -0,0 +1,90 @@
+"""
+Aho-Corasick automaton for counting many byte patterns in one pass.
+
+The automaton is compiled into a flat transition table with one row of 256
+entries per trie state, so scanning a text costs one list lookup per byte
+regardless of how many patterns there are. Hits are tallied per state while
+scanning and pushed down the failure links once at the end, instead of
+walking every state's output list on every byte.
+"""
+
+from collections import deque
+
+ALPHABET_SIZE = 256
+
+
+class AhoCorasick:
+    """
+    Counts the (possibly overlapping) occurrences of a set of byte patterns.
+
+    Attributes:
+        patterns (list of bytes): The distinct patterns, in insertion order.
+    """
+
+    def __init__(self, patterns):
+        """
+        Builds the automaton for the given non-empty byte patterns.
+        """
+        self.patterns = list(dict.fromkeys(patterns))
+        if any(not pattern for pattern in self.patterns):
+            raise ValueError("Patterns must not be empty")
+
+        # Trie
+        children = [{}]
+        terminals = []
+        for pattern in self.patterns:
+            state = 0
+            for byte in pattern:
+                if byte not in children[state]:
+                    children[state][byte] = len(children)
+                    children.append({})
+                state = children[state][byte]
+            terminals.append(state)
+
+        # Failure links and the full transition table, in breadth-first order
+        num_states = len(children)
+        table = [0] * (num_states * ALPHABET_SIZE)
+        fail = [0] * num_states
+        order = []
+        queue = deque()
+        for byte, child in children[0].items():
+            table[byte] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            row = state * ALPHABET_SIZE
+            fail_row = fail[state] * ALPHABET_SIZE
+            table[row:row + ALPHABET_SIZE] = table[fail_row:fail_row + ALPHABET_SIZE]
+            for byte, child in children[state].items():
+                fail[child] = table[fail_row + byte]
+                table[row + byte] = child
+                queue.append(child)
+
+        self._table = table
+        self._fail = fail
+        self._order = order
+        self._terminals = terminals
+
+    def count(self, texts):
+        """
+        Counts the occurrences of every pattern in a sequence of byte strings.
+        Matches never span two texts.
+
+        Returns:
+            dict: Pattern (bytes) to number of occurrences.
+        """
+        table = self._table
+        hits = [0] * len(self._fail)
+
+        for text in texts:
+            state = 0
+            for byte in text:
+                state = table[state * ALPHABET_SIZE + byte]
+                hits[state] += 1
+
+        # A hit at a state is also a hit for every state on its failure chain
+        for state in reversed(self._order):
+            hits[self._fail[state]] += hits[state]
+
+        return {pattern: hits[terminal] for pattern, terminal in zip(self.patterns, self._terminals)}
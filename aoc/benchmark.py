@@ -0,0 +1,162 @@
+"""
+Benchmarks how the solutions of Days 1-10 scale with input size.
+
+For each day a synthetic input is generated at every size multiplier and
+solved with the runner's run_day(). The growth rate is estimated with a
+least-squares fit of log(wall time) against log(size), so an exponent of
+about 1 means linear scaling and about 2 means quadratic. Before each size
+its time is predicted from the previous run and the exponent fitted so far,
+and that size and all larger ones are skipped once the prediction (or a
+measured run) exceeds the time budget.
+
+Usage:
+    python -m aoc.benchmark [DAYS ...] [--scales 1 10 100 1000]
+                            [--budget SECONDS] [--output results.json]
+"""
+
+import argparse
+import json
+import math
+import tempfile
+from pathlib import Path
+
+from aoc.generators import GENERATORS, write_input
+from aoc.runner import parse_days, run_day
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+# Growth exponent assumed when predicting from a single run
+DEFAULT_EXPONENT = 2.0
+
+
+def fit_growth_exponent(sizes, times):
+    """
+    Fits time = a * size^k by least squares in log-log space and returns k.
+
+    Args:
+        sizes (list of int): Input sizes.
+        times (list of float): Measured times in seconds.
+
+    Returns:
+        float: The fitted exponent, or None with fewer than two usable points.
+    """
+    points = [(math.log(size), math.log(t)) for size, t in zip(sizes, times) if size > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def predict_wall(runs, scale):
+    """
+    Predicts the wall time of a run at the given scale from the runs so far.
+
+    The time is extrapolated from the last run with the exponent fitted over
+    all of them, or DEFAULT_EXPONENT after a single run. The exponent is taken
+    as at least 1, since no day is faster than reading its input and tiny runs
+    give noisy fits.
+
+    Returns:
+        float: The predicted time in seconds, or None without a previous run.
+    """
+    if not runs:
+        return None
+    exponent = fit_growth_exponent([run['scale'] for run in runs], [run['wall'] for run in runs])
+    exponent = DEFAULT_EXPONENT if exponent is None else max(exponent, 1.0)
+    last = runs[-1]
+    return last['wall'] * (scale / last['scale']) ** exponent
+
+
+def benchmark_day(day, scales, budget, work_dir, seed=0):
+    """
+    Runs one day at every scale until a run exceeds, or is predicted to
+    exceed, the time budget.
+
+    Returns:
+        dict: The day, one entry per measured scale, the scales skipped with
+              their predicted times, and the fitted exponent.
+    """
+    runs = []
+    skipped = []
+    for i, scale in enumerate(scales):
+        predicted = predict_wall(runs, scale)
+        if predicted is not None and predicted > budget:
+            skipped = [{'scale': later, 'predicted_wall': predict_wall(runs, later)} for later in scales[i:]]
+            print(f"Day {day} x{scale}: skipped, predicted {predicted:.1f}s exceeds the {budget:g}s budget")
+            break
+
+        input_file = Path(work_dir) / f"day{day}_x{scale}.txt"
+        write_input(day, scale, input_file, seed=seed)
+        if not runs:
+            # An untimed first run absorbs one-off costs such as NumPy's lazy initialisation
+            run_day(day, input_file)
+        result = run_day(day, input_file)
+        input_bytes = input_file.stat().st_size
+        input_file.unlink()
+
+        runs.append({
+            'scale': scale,
+            'input_bytes': input_bytes,
+            'wall': result['wall'],
+            'cpu': result['cpu'],
+            'peak_rss_kb': result['peak_rss_kb'],
+            'child_peak_rss_kb': result['child_peak_rss_kb'],
+            'part_1': result['part_1'],
+            'part_2': result['part_2'],
+            'error': result['error'],
+        })
+        print(f"Day {day} x{scale}: {result['wall']:.3f}s" + (f" ({result['error']})" if result['error'] else ''))
+
+        if result['error'] or result['wall'] > budget:
+            break
+
+    measured = [run for run in runs if not run['error']]
+    return {
+        'day': day,
+        'runs': runs,
+        'skipped': skipped,
+        'growth_exponent': fit_growth_exponent([run['input_bytes'] for run in measured],
+                                               [run['wall'] for run in measured]),
+    }
+
+
+def main(argv=None):
+    """
+    Command-line entry point for `python -m aoc.benchmark`.
+    """
+    parser = argparse.ArgumentParser(prog='aoc.benchmark', description='Measure how each day scales with input size.')
+    parser.add_argument('days', nargs='*', help='days to benchmark, e.g. 1 3 5-9 (default: 1-10)')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES), help='size multipliers')
+    parser.add_argument('--budget', type=float, default=60.0, help='skip sizes predicted or measured to take longer than this (seconds)')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON file to write')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    days = parse_days(args.days) if args.days else sorted(GENERATORS)
+    missing = [day for day in days if day not in GENERATORS]
+    if missing:
+        parser.error(f"No generator for day(s): {missing}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for day in days:
+            results.append(benchmark_day(day, sorted(args.scales), args.budget, work_dir, seed=args.seed))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    for result in results:
+        exponent = result['growth_exponent']
+        skipped = ', '.join(f"x{entry['scale']}" for entry in result['skipped'])
+        print(f"Day {result['day']}: " + ('n/a' if exponent is None else f"time ~ n^{exponent:.2f}")
+              + (f" (skipped {skipped})" if skipped else ''))
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
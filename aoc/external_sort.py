@@ -0,0 +1,95 @@
+"""
+External sorting of int64 streams that do not fit in memory.
+
+Values are sorted in memory-sized chunks and written to run files as raw
+int64. The runs are then merged lazily with a k-way heap merge that reads
+each run one block at a time. Memory use stays at one block per run.
+"""
+
+import heapq
+
+import numpy as np
+
+BLOCK_VALUES = 1 << 16  # Values read from a run file at a time
+
+
+def iter_chunks(file_path, chunk_bytes):
+    """
+    Reads a file in chunks of about chunk_bytes that end on a line boundary.
+
+    Yields:
+        bytes: Whole lines; only the final chunk may lack a trailing newline.
+    """
+    remainder = b''
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            block = remainder + block
+            cut = block.rfind(b'\n') + 1
+            if cut:
+                remainder = block[cut:]
+                yield block[:cut]
+            else:
+                remainder = block
+    if remainder:
+        yield remainder
+
+
+def write_run(values, path):
+    """
+    Sorts an int64 array and writes it to path as a run file.
+    """
+    np.sort(np.asarray(values, dtype=np.int64)).tofile(path)
+    return path
+
+
+def iter_int64_file(path, block_values=BLOCK_VALUES):
+    """
+    Yields the int64 values stored in a raw binary file, one block at a time.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            block = np.fromfile(f, dtype=np.int64, count=block_values)
+            if not block.size:
+                break
+            yield from block.tolist()
+
+
+def merge_runs(paths, block_values=BLOCK_VALUES):
+    """
+    Lazily merges sorted run files into one sorted stream of Python ints.
+    """
+    return heapq.merge(*(iter_int64_file(path, block_values) for path in paths))
+
+
+class Int64Writer:
+    """
+    Buffered writer appending Python ints to a raw int64 file.
+    """
+
+    def __init__(self, path, block_values=BLOCK_VALUES):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._buffer = []
+        self._block_values = block_values
+
+    def write(self, *values):
+        self._buffer.extend(values)
+        if len(self._buffer) >= self._block_values:
+            self.flush()
+
+    def flush(self):
+        np.array(self._buffer, dtype=np.int64).tofile(self._file)
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
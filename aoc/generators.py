@@ -0,0 +1,265 @@
+"""
+Synthetic input generators for Days 1-10.
+
+Every generator writes a valid puzzle input whose size is `scale` times the
+size of the committed input.txt for that day. Line-based inputs scale the
+number of lines, grid inputs scale the area and Day 9 scales the disk map
+length. The output is deterministic for a given seed.
+
+Usage:
+    python -m aoc.generators DAY SCALE OUTPUT [--seed SEED]
+"""
+
+import argparse
+import math
+import random
+import string
+
+# Base sizes matching the committed inputs
+DAY1_LINES = 1000
+DAY2_LINES = 1000
+DAY3_CHARS = 18000
+DAY4_SIDE = 140
+DAY5_PAGES = 49
+DAY5_UPDATES = 200
+DAY6_SIDE = 130
+DAY7_LINES = 850
+DAY8_SIDE = 50
+DAY9_LENGTH = 19999
+DAY10_SIDE = 55
+
+
+def _scaled_side(side, scale):
+    """
+    Returns the side length of a square grid with `scale` times the area.
+    """
+    return max(1, round(side * math.sqrt(scale)))
+
+
+def generate_day1(f, scale, rng):
+    """
+    Two columns of five-digit location IDs.
+    """
+    for _ in range(DAY1_LINES * scale):
+        f.write(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n")
+
+
+def generate_day2(f, scale, rng):
+    """
+    Reports of 5-8 levels, most of them at most one bad level away from safe.
+    """
+    for _ in range(DAY2_LINES * scale):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            if rng.random() < 0.1:
+                level += rng.randint(-4, 4)  # Possibly unsafe step
+            else:
+                level += sign * rng.randint(1, 3)
+            report.append(level)
+        f.write(' '.join(map(str, report)) + '\n')
+
+
+def generate_day3(f, scale, rng):
+    """
+    Corrupted memory with mul(x,y), do() and don't() instructions among noise.
+    """
+    noise = "!@#$%^&*()[]{}<>?/\\,'; mul)(don do what who from select when"
+    written = 0
+    target = DAY3_CHARS * scale
+    chunk = []
+    while written < target:
+        roll = rng.random()
+        if roll < 0.08:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.09:
+            token = "do()"
+        elif roll < 0.10:
+            token = "don't()"
+        elif roll < 0.11:
+            token = f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})"  # Invalid spacing
+        else:
+            token = rng.choice(noise)
+        chunk.append(token)
+        written += len(token)
+        if len(chunk) >= 4096:
+            f.write(''.join(chunk))
+            chunk = []
+    f.write(''.join(chunk) + '\n')
+
+
+def generate_day4(f, scale, rng):
+    """
+    A square grid of the letters X, M, A and S.
+    """
+    side = _scaled_side(DAY4_SIDE, scale)
+    for _ in range(side):
+        f.write(''.join(rng.choice('XMAS') for _ in range(side)) + '\n')
+
+
+def generate_day5(f, scale, rng):
+    """
+    A complete set of ordering rules over a shuffled page order, followed by
+    odd-length updates drawn from those pages.
+    """
+    pages = rng.sample(range(10, 100), DAY5_PAGES)
+    for i in range(len(pages)):
+        for j in range(i + 1, len(pages)):
+            f.write(f"{pages[i]}|{pages[j]}\n")
+    f.write('\n')
+
+    for _ in range(DAY5_UPDATES * scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        f.write(','.join(map(str, update)) + '\n')
+
+
+def _guard_exits(grid, start):
+    """
+    Checks that the Day 6 guard leaves the grid instead of walking in a loop.
+    """
+    rows, cols = len(grid), len(grid[0])
+    (r, c), (dr, dc) = start, (-1, 0)
+    seen = set()
+    while True:
+        if (r, c, dr, dc) in seen:
+            return False
+        seen.add((r, c, dr, dc))
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < rows and 0 <= nc < cols):
+            return True
+        if grid[nr][nc] == '#':
+            dr, dc = dc, -dr
+        else:
+            r, c = nr, nc
+
+
+def generate_day6(f, scale, rng):
+    """
+    A square lab map with about 1% obstacles and a guard facing up whose
+    patrol leaves the map.
+    """
+    side = _scaled_side(DAY6_SIDE, scale)
+    while True:
+        grid = [['#' if rng.random() < 0.01 else '.' for _ in range(side)] for _ in range(side)]
+        start = (rng.randrange(side // 2, side), rng.randrange(side))
+        grid[start[0]][start[1]] = '^'
+        if _guard_exits(grid, start):
+            break
+
+    for row in grid:
+        f.write(''.join(row) + '\n')
+
+
+def generate_day7(f, scale, rng):
+    """
+    Calibration equations with 3-12 operands, about half of them solvable.
+    """
+    for _ in range(DAY7_LINES * scale):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            target = operands[0]
+            for operand in operands[1:]:
+                op = rng.choice('+*|')
+                if op == '+':
+                    target += operand
+                elif op == '*':
+                    target *= operand
+                else:
+                    target = int(f"{target}{operand}")
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 12))
+        f.write(f"{target}: {' '.join(map(str, operands))}\n")
+
+
+def generate_day8(f, scale, rng):
+    """
+    A square map with about four antennas per frequency.
+    """
+    side = _scaled_side(DAY8_SIDE, scale)
+    grid = [['.'] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    cells = rng.sample(range(side * side), min(side * side, side * side // 12))
+    for i, cell in enumerate(cells):
+        grid[cell // side][cell % side] = frequencies[i % len(frequencies)]
+
+    for row in grid:
+        f.write(''.join(row) + '\n')
+
+
+def generate_day9(f, scale, rng):
+    """
+    A dense disk map: file lengths 1-9 alternating with free-space lengths 0-9.
+    """
+    length = DAY9_LENGTH * scale
+    if length % 2 == 0:
+        length += 1  # The map always ends with a file
+    f.write(''.join(str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(length)) + '\n')
+
+
+def generate_day10(f, scale, rng):
+    """
+    A smooth topographic map, so that trails of increasing height exist.
+    """
+    side = _scaled_side(DAY10_SIDE, scale)
+    waves = [(rng.uniform(0.1, 0.4), rng.uniform(0.1, 0.4), rng.uniform(0, 2 * math.pi)) for _ in range(3)]
+    for r in range(side):
+        row = []
+        for c in range(side):
+            height = sum(math.sin(r * fr + c * fc + phase) for fr, fc, phase in waves)
+            row.append(str(min(9, int((height + 3) * 10 / 6))))
+        f.write(''.join(row) + '\n')
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+}
+
+
+def write_input(day, scale, output_path, seed=0):
+    """
+    Writes a synthetic input for the given day.
+
+    Args:
+        day (int): Day number (1-10).
+        scale (int): Size multiplier relative to the committed input.
+        output_path (Path): File to write.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        Path: The written file.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+
+    rng = random.Random(seed * 100 + day)
+    with open(output_path, 'w') as f:
+        GENERATORS[day](f, scale, rng)
+    return output_path
+
+
+def main(argv=None):
+    """
+    Command-line entry point for `python -m aoc.generators`.
+    """
+    parser = argparse.ArgumentParser(prog='aoc.generators', description='Write a synthetic puzzle input.')
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS))
+    parser.add_argument('scale', type=int, help='size multiplier relative to the committed input')
+    parser.add_argument('output', help='file to write')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    write_input(args.day, args.scale, args.output, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Compact character grids shared by the grid days.
+
+Grid stores the grid as one flat bytearray surrounded by a one-cell border
+of padding bytes. Cell (r, c) lives at index (r + 1) * stride + (c + 1),
+where stride = cols + 2. Because of the border, a single step from any cell
+in any direction always lands on a valid index, and a step off the grid is
+detected by reading a padding byte instead of comparing against the grid
+size.
+
+MappedGrid is a read-only view straight over the bytes of a memory-mapped
+input file. Cell (r, c) lives at index r * stride + c, where stride =
+cols + 1 skips the newline ending each row. Loading takes constant time and
+no per-row memory. Edits go to a copy-on-write overlay and never touch the
+file.
+"""
+
+import mmap
+
+import numpy as np
+
+PAD = 0  # Padding byte around the grid; never a puzzle character
+NEWLINE = ord('\n')
+
+
+class Grid:
+    """
+    Flat, padded byte grid.
+
+    Attributes:
+        rows (int): Number of rows, excluding the border.
+        cols (int): Number of columns, excluding the border.
+        stride (int): Distance between vertically adjacent cells.
+        data (bytearray): Grid bytes including the border.
+        orthogonal_offsets (tuple): Index offsets of the 4 neighbours,
+            clockwise from up: up, right, down, left.
+        neighbour_offsets (tuple): Index offsets of the 8 neighbours,
+            clockwise from up.
+    """
+
+    def __init__(self, lines):
+        """
+        Builds the grid from a list of equal-length strings.
+        """
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.stride = self.cols + 2
+        self.data = bytearray(self.stride * (self.rows + 2))
+        for r, line in enumerate(lines):
+            start = (r + 1) * self.stride + 1
+            self.data[start:start + self.cols] = line.encode()
+
+        s = self.stride
+        self.orthogonal_offsets = (-s, 1, s, -1)
+        self.neighbour_offsets = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Reads a grid from a file with one row per line.
+        """
+        with open(file_path, 'r') as f:
+            return cls([line for line in (line.strip() for line in f) if line])
+
+    def index(self, r, c):
+        """
+        Returns the flat index of cell (r, c).
+        """
+        return (r + 1) * self.stride + c + 1
+
+    def coords(self, i):
+        """
+        Returns the (r, c) coordinates of flat index i.
+        """
+        r, c = divmod(i, self.stride)
+        return r - 1, c - 1
+
+    def contains(self, r, c):
+        """
+        Checks if (r, c) is within the grid.
+        """
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def indices(self):
+        """
+        Yields the flat index of every cell, row by row.
+        """
+        for r in range(1, self.rows + 1):
+            start = r * self.stride + 1
+            yield from range(start, start + self.cols)
+
+    def find(self, char):
+        """
+        Returns the flat index of the first cell holding char, or -1.
+        """
+        return self.data.find(char.encode())
+
+    def positions_of(self, char):
+        """
+        Returns the flat indices of every cell holding char, in row order.
+        """
+        target = char.encode()
+        positions = []
+        i = self.data.find(target)
+        while i != -1:
+            positions.append(i)
+            i = self.data.find(target, i + 1)
+        return positions
+
+    def __getitem__(self, i):
+        return chr(self.data[i])
+
+    def __setitem__(self, i, char):
+        self.data[i] = ord(char)
+
+    def get(self, r, c):
+        """
+        Returns the character at (r, c).
+        """
+        return chr(self.data[self.index(r, c)])
+
+    def set(self, r, c, char):
+        """
+        Sets the character at (r, c).
+        """
+        self.data[self.index(r, c)] = ord(char)
+
+    def to_numpy(self):
+        """
+        Returns the cells (without the border) as a 2D uint8 array sharing
+        memory with the grid.
+        """
+        padded = np.frombuffer(self.data, dtype=np.uint8).reshape(self.rows + 2, self.stride)
+        return padded[1:-1, 1:-1]
+
+    def copy(self):
+        """
+        Returns an independent copy of the grid.
+        """
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.data = bytearray(self.data)
+        return grid
+
+    def __str__(self):
+        return '\n'.join(
+            self.data[r * self.stride + 1:r * self.stride + 1 + self.cols].decode()
+            for r in range(1, self.rows + 1)
+        )
+
+
+class MappedGrid:
+    """
+    Read-only grid view over a memory-mapped file, with a copy-on-write overlay.
+
+    The newline ending each row doubles as a sentinel for steps off the left
+    and right edges. Steps off the top or bottom leave the range of data, so
+    use in_bounds() for a single step from a cell.
+
+    Attributes:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        stride (int): Distance between vertically adjacent cells (cols + 1).
+        data (memoryview): Read-only file bytes, without the overlay applied.
+        overlay (dict): Edited cells, mapping flat index to byte value.
+        orthogonal_offsets (tuple): Index offsets of the 4 neighbours,
+            clockwise from up: up, right, down, left.
+        neighbour_offsets (tuple): Index offsets of the 8 neighbours,
+            clockwise from up.
+    """
+
+    def __init__(self, buffer):
+        """
+        Wraps a bytes-like buffer holding newline-terminated rows.
+        """
+        self._buffer = buffer
+        self.data = memoryview(buffer)
+        self.overlay = {}
+
+        cols = buffer.find(b'\n')
+        if cols == -1:
+            cols = len(buffer)
+        elif cols and buffer[cols - 1] == ord('\r'):
+            raise ValueError("MappedGrid requires '\\n' line endings; use Grid for CRLF input")
+        self.cols = cols
+        self.stride = cols + 1
+        self.rows = (len(buffer) + 1) // self.stride if cols else 0
+
+        s = self.stride
+        self.orthogonal_offsets = (-s, 1, s, -1)
+        self.neighbour_offsets = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """
+        Memory-maps a grid file with one row per line.
+        """
+        with open(file_path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def index(self, r, c):
+        """
+        Returns the flat index of cell (r, c).
+        """
+        return r * self.stride + c
+
+    def coords(self, i):
+        """
+        Returns the (r, c) coordinates of flat index i.
+        """
+        return divmod(i, self.stride)
+
+    def contains(self, r, c):
+        """
+        Checks if (r, c) is within the grid.
+        """
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def in_bounds(self, i):
+        """
+        Checks if the index reached by a single step from a cell is on the grid.
+        """
+        return 0 <= i < len(self.data) and self.data[i] != NEWLINE
+
+    def indices(self):
+        """
+        Yields the flat index of every cell, row by row.
+        """
+        for r in range(self.rows):
+            start = r * self.stride
+            yield from range(start, start + self.cols)
+
+    def cell(self, i):
+        """
+        Returns the byte value at flat index i, with the overlay applied.
+        """
+        return self.overlay.get(i, self.data[i])
+
+    def positions_of(self, char):
+        """
+        Returns the flat indices of every cell holding char, in row order.
+        """
+        target = ord(char)
+        needle = char.encode()
+        positions = []
+        i = self._buffer.find(needle)
+        while i != -1:
+            if i not in self.overlay:
+                positions.append(i)
+            i = self._buffer.find(needle, i + 1)
+
+        edited = [i for i, value in self.overlay.items() if value == target]
+        return sorted(positions + edited) if edited else positions
+
+    def find(self, char):
+        """
+        Returns the flat index of the first cell holding char, or -1.
+        """
+        if not self.overlay:
+            return self._buffer.find(char.encode())
+        positions = self.positions_of(char)
+        return positions[0] if positions else -1
+
+    def __getitem__(self, i):
+        return chr(self.cell(i))
+
+    def __setitem__(self, i, char):
+        self.overlay[i] = ord(char)
+
+    def get(self, r, c):
+        """
+        Returns the character at (r, c).
+        """
+        return chr(self.cell(self.index(r, c)))
+
+    def set(self, r, c, char):
+        """
+        Sets the character at (r, c) in the overlay.
+        """
+        self.overlay[self.index(r, c)] = ord(char)
+
+    def to_numpy(self):
+        """
+        Returns a read-only (rows, cols) uint8 view of the mapped bytes, without
+        the overlay or the newlines. No data is copied.
+        """
+        buf = np.frombuffer(self._buffer, dtype=np.uint8)
+        return np.lib.stride_tricks.as_strided(buf, shape=(self.rows, self.cols), strides=(self.stride, 1),
+                                               writeable=False)
+
+    def copy(self):
+        """
+        Returns a grid sharing the mapped bytes with its own copy of the overlay.
+        """
+        grid = MappedGrid.__new__(MappedGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.overlay = dict(self.overlay)
+        return grid
+
+    def __str__(self):
+        return '\n'.join(''.join(self[i] for i in range(r * self.stride, r * self.stride + self.cols))
+                         for r in range(self.rows))
@@ -0,0 +1,140 @@
+"""
+Bulk NumPy parsing for inputs made of whitespace-separated integers.
+
+The whole file is read as bytes and every integer is decoded at once with
+vectorised digit arithmetic, instead of calling split() and int() line by
+line. Tables with a fixed number of columns come back as int64 columns, and
+ragged rows come back in CSR form: a flat `values` array plus an `offsets`
+array where row i is values[offsets[i]:offsets[i + 1]].
+
+Any non-digit byte separates numbers, so separators such as ':' or ','
+need no special handling, and a '-' directly before a number is its sign.
+Integers with up to 18 digits come back as int64. If any integer is longer,
+the values come back as an object array of exact Python ints instead.
+"""
+
+import numpy as np
+
+MAX_DIGITS = 18  # Longest integers decoded as int64
+
+
+def parse_ints(data):
+    """
+    Decodes every integer in a bytes buffer.
+
+    Args:
+        data (bytes): The raw file contents.
+
+    Returns:
+        tuple: Two arrays:
+               - values: The integers in file order, as int64, or as Python ints
+                 (object dtype) if any has more than MAX_DIGITS digits.
+               - rows: The (0-based) line number of each integer.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (buf >= ord('0')) & (buf <= ord('9'))
+
+    # Numbers start where a digit follows a non-digit and end at the reverse
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    # A '-' directly before the first digit makes the number negative
+    negative = np.zeros(starts.size, dtype=bool)
+    has_prefix = starts > 0
+    negative[has_prefix] = buf[starts[has_prefix] - 1] == ord('-')
+
+    if lengths.size and lengths.max() > MAX_DIGITS:
+        # Too long for int64: decode each number exactly as a Python int
+        values = np.empty(starts.size, dtype=object)
+        values[:] = [int(data[start:end]) for start, end in zip(starts.tolist(), ends.tolist())]
+    else:
+        # Add each number's digits from least significant up, one place value at a time
+        values = np.zeros(starts.size, dtype=np.int64)
+        place = 1
+        for k in range(int(lengths.max()) if lengths.size else 0):
+            has_digit = lengths > k
+            values[has_digit] += (buf[ends[has_digit] - 1 - k].astype(np.int64) - ord('0')) * place
+            place *= 10
+    values[negative] *= -1
+
+    newlines = np.flatnonzero(buf == ord('\n'))
+    rows = np.searchsorted(newlines, starts)
+
+    return values, rows
+
+
+def read_int_columns(file_path, num_columns):
+    """
+    Reads a table with a fixed number of integers per line.
+
+    Args:
+        file_path (Path): Path to the input file.
+        num_columns (int): Number of integers on every line.
+
+    Returns:
+        tuple: One int64 array per column.
+    """
+    with open(file_path, 'rb') as f:
+        values, _ = parse_ints(f.read())
+
+    if values.size % num_columns:
+        raise ValueError(f"Expected {num_columns} integers per line")
+    table = values.reshape(-1, num_columns)
+    return tuple(np.ascontiguousarray(table[:, i]) for i in range(num_columns))
+
+
+def read_int_rows(file_path):
+    """
+    Reads lines holding any number of integers into CSR form. Blank lines
+    are skipped.
+
+    Args:
+        file_path (Path): Path to the input file.
+
+    Returns:
+        tuple: Two int64 arrays:
+               - values: All integers in file order.
+               - offsets: Row boundaries, so row i is values[offsets[i]:offsets[i + 1]].
+    """
+    with open(file_path, 'rb') as f:
+        values, rows = parse_ints(f.read())
+
+    # Renumber rows so that blank lines do not produce empty rows
+    row_starts = np.flatnonzero(np.diff(rows, prepend=-1))
+    offsets = np.append(row_starts, values.size)
+    return values, offsets
+
+
+def read_labelled_int_rows(file_path):
+    """
+    Reads lines of the form "label: a b c ..." into a label array plus the
+    remaining integers in CSR form.
+
+    Args:
+        file_path (Path): Path to the input file.
+
+    Returns:
+        tuple: Three int64 arrays:
+               - labels: The first integer of each line.
+               - values: The remaining integers in file order.
+               - offsets: Row boundaries, so row i is values[offsets[i]:offsets[i + 1]].
+    """
+    values, offsets = read_int_rows(file_path)
+    labels = values[offsets[:-1]]
+
+    # Drop the labels and shift every boundary left by the labels removed before it
+    keep = np.ones(values.size, dtype=bool)
+    keep[offsets[:-1]] = False
+    offsets = offsets - np.arange(offsets.size)
+    return labels, values[keep], offsets
+
+
+def csr_to_lists(values, offsets):
+    """
+    Converts CSR rows to a list of Python int lists.
+    """
+    flat = values.tolist()
+    bounds = offsets.tolist()
+    return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
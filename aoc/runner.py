@@ -0,0 +1,245 @@
+"""
+Runs any set of days concurrently on a process pool.
+
+Each day's module is imported and its solve() function is called directly,
+so no subprocess or extra interpreter is started per day. Every day reports
+its answers together with wall time, CPU time and peak RSS, counting any
+worker processes the day starts itself.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ALL_DAYS = range(1, 26)
+
+
+def day_directory(day):
+    """
+    Returns the directory holding the solution and input for a day.
+    """
+    return REPO_ROOT / f"Day {day}"
+
+
+def load_day_module(day):
+    """
+    Imports Day N/dayN.py as the module `dayN` without running its main().
+
+    The day's directory and the repository root are put on sys.path so the
+    day can import its sibling modules and the shared `aoc` package.
+    """
+    module_name = f"day{day}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    day_dir = day_directory(day)
+    for path in (str(REPO_ROOT), str(day_dir)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    spec = importlib.util.spec_from_file_location(module_name, day_dir / f"{module_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _reset_peak_rss():
+    """
+    Resets the peak RSS high-water mark of this process where the OS allows it.
+    Pool workers are reused, so without this a day would inherit the peak of
+    whichever day ran before it in the same worker.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _peak_rss_kb():
+    """
+    Returns the peak RSS of this process in KiB, or None if it is unavailable.
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _children_usage():
+    """
+    Returns the CPU time in seconds used by the waited-for child processes of
+    this process, and the peak RSS in KiB of the largest of them.
+    Both are zero where the OS does not report them.
+    """
+    if resource is None:
+        return 0.0, 0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # macOS reports bytes, Linux reports KiB
+    peak = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return usage.ru_utime + usage.ru_stime, peak
+
+
+def run_day(day, input_file=None):
+    """
+    Solves a single day in the current process and measures it.
+
+    Args:
+        day (int): The day number.
+        input_file (Path): Input to solve. Defaults to the day's input.txt.
+
+    Returns:
+        dict: The day, both answers, wall time and CPU time in seconds,
+              peak RSS in KiB, the peak RSS in KiB of the largest worker
+              process the day started (None if it started none) and an
+              error message if the day failed. CPU time includes the
+              day's worker processes.
+    """
+    if input_file is None:
+        input_file = day_directory(day) / 'input.txt'
+
+    result = {
+        'day': day, 'part_1': None, 'part_2': None,
+        'wall': 0.0, 'cpu': 0.0, 'peak_rss_kb': None,
+        'child_peak_rss_kb': None, 'error': None,
+    }
+
+    # Import the day (and NumPy) before starting the clock, so only solve() is measured
+    try:
+        module = load_day_module(day)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    _reset_peak_rss()
+    children_cpu_start, _ = _children_usage()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        result['part_1'], result['part_2'] = module.solve(input_file)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['wall'] = time.perf_counter() - wall_start
+    result['cpu'] = time.process_time() - cpu_start
+    result['peak_rss_kb'] = _peak_rss_kb()
+
+    # Days that start their own worker processes (e.g. Day 6 Part 2) spend most
+    # of their CPU time and memory in them, which process_time() and VmHWM miss
+    children_cpu_end, children_peak = _children_usage()
+    if children_cpu_end > children_cpu_start:
+        result['cpu'] += children_cpu_end - children_cpu_start
+        result['child_peak_rss_kb'] = children_peak
+
+    return result
+
+
+def run_days(days, max_workers=None):
+    """
+    Solves the given days concurrently on a process pool.
+
+    Args:
+        days (iterable of int): Day numbers to run.
+        max_workers (int): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        list of dict: One result per day (see run_day), sorted by day.
+    """
+    days = sorted(set(days))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(days)))
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_day, day) for day in days]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    return sorted(results, key=lambda result: result['day'])
+
+
+def format_table(results):
+    """
+    Formats the results as a fixed-width text table.
+    """
+    headers = ('Day', 'Part 1', 'Part 2', 'Wall (s)', 'CPU (s)', 'Peak RSS (MiB)', 'Child RSS (MiB)')
+    rows = []
+    for result in results:
+        if result['error']:
+            part_1, part_2 = 'ERROR', result['error']
+        else:
+            part_1 = '-' if result['part_1'] is None else str(result['part_1'])
+            part_2 = '-' if result['part_2'] is None else str(result['part_2'])
+        rss = '-' if result['peak_rss_kb'] is None else f"{result['peak_rss_kb'] / 1024:.1f}"
+        child_rss = '-' if result['child_peak_rss_kb'] is None else f"{result['child_peak_rss_kb'] / 1024:.1f}"
+        rows.append((str(result['day']), part_1, part_2, f"{result['wall']:.3f}", f"{result['cpu']:.3f}", rss,
+                     child_rss))
+
+    widths = [max(len(row[i]) for row in rows + [headers]) for i in range(len(headers))]
+    lines = ['  '.join(header.ljust(width) for header, width in zip(headers, widths))]
+    lines.append('  '.join('-' * width for width in widths))
+    for row in rows:
+        lines.append('  '.join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
+
+
+def parse_days(specs):
+    """
+    Parses day selections such as ['1', '3', '5-9'] into a sorted list of days.
+    """
+    days = set()
+    for spec in specs:
+        if '-' in spec:
+            first, last = map(int, spec.split('-'))
+            days.update(range(first, last + 1))
+        else:
+            days.add(int(spec))
+
+    invalid = [day for day in days if day not in ALL_DAYS]
+    if invalid:
+        raise ValueError(f"Invalid day(s): {invalid}")
+    return sorted(days)
+
+
+def main(argv=None):
+    """
+    Command-line entry point for `python -m aoc`.
+    """
+    parser = argparse.ArgumentParser(prog='aoc', description='Run Advent of Code 2024 days in parallel.')
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 1 3 5-9 (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='number of worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    try:
+        days = parse_days(args.days) if args.days else list(ALL_DAYS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    results = run_days(days, max_workers=args.jobs)
+    elapsed = time.perf_counter() - start
+
+    print(format_table(results))
+    print(f"\nTotal wall time: {elapsed:.3f}s")
+
+    if any(result['error'] for result in results):
+        sys.exit(1)
@@ -0,0 +1,105 @@
+"""
+Small 2D patterns ("stencils") with wildcards, matched against a letter grid.
+
+A stencil is written as rows of text, where the wildcard character matches
+any cell. Its rotations and reflections can be generated instead of written
+by hand. Matching builds one boolean mask per character used by any
+stencil, then ANDs shifted slices of those masks, so every placement on the
+grid is tested at once.
+"""
+
+import numpy as np
+
+WILDCARD = '.'
+
+
+class Stencil:
+    """
+    A rectangular pattern of characters and wildcards.
+
+    Attributes:
+        rows (tuple of str): The pattern, one string per row.
+        wildcard (str): The character matching any cell.
+        height (int): Number of rows.
+        width (int): Number of columns.
+        cells (tuple): (row offset, column offset, byte) of every non-wildcard cell.
+    """
+
+    def __init__(self, rows, wildcard=WILDCARD):
+        """
+        Builds a stencil from equal-length rows of text.
+        """
+        self.rows = tuple(rows)
+        self.wildcard = wildcard
+        self.height = len(self.rows)
+        self.width = len(self.rows[0]) if self.rows else 0
+        if not self.width or any(len(row) != self.width for row in self.rows):
+            raise ValueError("A stencil must be a non-empty rectangle")
+
+        self.cells = tuple(
+            (r, c, ord(char))
+            for r, row in enumerate(self.rows)
+            for c, char in enumerate(row)
+            if char != wildcard
+        )
+
+    def rotated(self):
+        """
+        Returns the stencil rotated 90 degrees clockwise.
+        """
+        return Stencil([''.join(row[c] for row in reversed(self.rows)) for c in range(self.width)], self.wildcard)
+
+    def reflected(self):
+        """
+        Returns the stencil mirrored left to right.
+        """
+        return Stencil([row[::-1] for row in self.rows], self.wildcard)
+
+    def variants(self, rotations=True, reflections=False):
+        """
+        Returns the distinct stencils among this one and, optionally, its
+        rotations by 90, 180 and 270 degrees and their mirror images.
+        """
+        bases = [self, self.reflected()] if reflections else [self]
+        unique = {}
+        for stencil in bases:
+            for _ in range(4 if rotations else 1):
+                unique.setdefault(stencil.rows, stencil)
+                stencil = stencil.rotated()
+        return list(unique.values())
+
+    def __repr__(self):
+        return f"Stencil({list(self.rows)!r})"
+
+
+def count_matches(letters, stencils):
+    """
+    Counts the placements of the stencils on a letter grid.
+
+    Each (stencil, position) pair that matches counts once, so pass distinct
+    stencils (as returned by Stencil.variants) to count every orientation.
+
+    Args:
+        letters (np.ndarray): 2D uint8 array of grid characters.
+        stencils (iterable of Stencil): The patterns to look for.
+
+    Returns:
+        int: Number of matching placements.
+    """
+    rows, cols = letters.shape
+    masks = {}
+    count = 0
+
+    for stencil in stencils:
+        out_rows, out_cols = rows - stencil.height + 1, cols - stencil.width + 1
+        if out_rows <= 0 or out_cols <= 0:
+            continue
+
+        match = np.ones((out_rows, out_cols), dtype=bool)
+        for r, c, byte in stencil.cells:
+            if byte not in masks:
+                masks[byte] = letters == byte
+            match &= masks[byte][r:r + out_rows, c:c + out_cols]
+        count += int(match.sum())
+
+    return count
@@ -2,7 +2,6 @@
 import os
 
 basic_text = '''from pathlib import Path
-import subprocess
 
 def read_input_file(file_path):
     """
@@ -11,18 +10,25 @@ def read_input_file(file_path):
     with open(file_path, 'r') as f:
         return [list(line.strip()) for line in f]
 
+def solve(input_file):
+    """
+    Computes the solutions for Part 1 and Part 2.
+    """
+    # Read and parse the input data
+    grid = read_input_file(input_file)
+
+    return None, None
+
 def main():
     """
     Main function to compute solutions for Part 1 and Part 2.
     """
-    # Clear the terminal
-    subprocess.run(["cls"], shell=True)
-
     # Define the input file path
     input_file = Path(__file__).parent / 'input.txt'
 
-    # Read and parse the input data
-    grid = read_input_file(input_file)
+    part_1, part_2 = solve(input_file)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
 if __name__ == "__main__":
     main()